@@ -0,0 +1,56 @@
+""" Benchmark sequence detection in a list of paths.
+
+Compares the fileseq backend (`fileseq.findSequencesInList` plus per path
+discard of the remains) against the native backend, at 10k, 100k and 1M paths
+shaped like a farm manifest: many shots of 1000 frames plus a few single files.
+
+Usage: python benchmarks/bench_find_sequences.py
+"""
+import timeit
+
+from lite_media_core.path_utils.sequence import _utils
+
+
+FRAMES_PER_SHOT = 1000
+PATH_COUNTS = (10000, 100000, 1000000)
+
+
+def _get_paths(count: int) -> list:
+    """ Build a manifest of `count` paths.
+    """
+    paths = [
+        "/farm/shot%04d/render/img.%04d.exr" % (index // FRAMES_PER_SHOT, 1001 + index % FRAMES_PER_SHOT)
+        for index in range(count)
+    ]
+
+    # A few non-sequence entries, so there are remains to resolve.
+    for index in range(0, count, FRAMES_PER_SHOT * 10):
+        paths[index] = "/farm/shot%04d/notes.txt" % (index // FRAMES_PER_SHOT)
+
+    return paths
+
+
+def main(number: int = 1):
+    """ Run the benchmark and print results.
+    """
+    for count in PATH_COUNTS:
+        paths = _get_paths(count)
+        assert _utils.find_sequences_in_list(paths, _utils.BACKEND_FILESEQ) == _utils.find_sequences_in_list(
+            paths, _utils.BACKEND_NATIVE
+        )
+
+        before_duration = timeit.timeit(
+            lambda: _utils.find_sequences_in_list(paths, _utils.BACKEND_FILESEQ), number=number
+        ) / number
+        after_duration = timeit.timeit(
+            lambda: _utils.find_sequences_in_list(paths, _utils.BACKEND_NATIVE), number=number
+        ) / number
+        print(
+            f"{count:>8} paths    fileseq {before_duration:>7.2f} s"
+            f"    native {after_duration:>7.2f} s"
+            f"    ({count / after_duration:>10.0f} paths/s)"
+        )
+
+
+if __name__ == "__main__":
+    main()
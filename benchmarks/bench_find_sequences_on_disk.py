@@ -0,0 +1,84 @@
+""" Benchmark sequence discovery on disk.
+
+Compares the legacy discovery (`fileseq.findSequencesOnDisk` then sorted)
+against the scandir based discovery, ordered and unordered, on a directory
+of 500k frames split in 50 sequences.
+Reports the time to the first sequence, the total time and the peak memory.
+
+Usage: python benchmarks/bench_find_sequences_on_disk.py
+"""
+import os
+import shutil
+import tempfile
+import time
+import tracemalloc
+
+import fileseq
+
+from lite_media_core.path_utils.sequence import _utils
+
+
+SEQUENCE_COUNT = 50
+FRAMES_PER_SEQUENCE = 10000
+
+
+def _legacy_find_sequences_on_disk(data: str) -> list:
+    """ Discovery as done before the scandir based discovery.
+    """
+    for fileSeq_sequence in sorted(fileseq.findSequencesOnDisk(data), key=repr):
+        try:
+            _utils.validate_file_sequence(fileSeq_sequence)
+        except ValueError:
+            continue
+
+        yield _utils._conform_discovered_fileSeq(fileSeq_sequence)  # pylint: disable=protected-access
+
+
+def _measure(find_sequences) -> tuple:
+    """ Measure the time to the first sequence, the total time and the peak memory of a discovery.
+    Memory is traced in a separate run since tracing slows down the discovery.
+    """
+    start = time.perf_counter()
+    sequences = find_sequences()
+    next(sequences)
+    first = time.perf_counter() - start
+    for _ in sequences:
+        pass
+    total = time.perf_counter() - start
+
+    tracemalloc.start()
+    for _ in find_sequences():
+        pass
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return first, total, peak
+
+
+def main():
+    """ Run the benchmark and print results.
+    """
+    directory = tempfile.mkdtemp()
+
+    try:
+        for index in range(SEQUENCE_COUNT):
+            for frame in range(1, FRAMES_PER_SEQUENCE + 1):
+                open(os.path.join(directory, "shot%03d.%05d.exr" % (index, frame)), "w").close()
+
+        for label, find_sequences in (
+            ("before (fileseq)", lambda: _legacy_find_sequences_on_disk(directory)),
+            ("after (ordered)", lambda: _utils.find_sequences_on_disk(directory)),
+            ("after (unordered)", lambda: _utils.find_sequences_on_disk(directory, ordered=False)),
+        ):
+            first, total, peak = _measure(find_sequences)
+            print(
+                f"{label:<20} first {first:>6.2f} s    total {total:>6.2f} s"
+                f"    peak {peak / 1024 / 1024:>7.1f} MiB"
+            )
+
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
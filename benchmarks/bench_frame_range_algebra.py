@@ -0,0 +1,47 @@
+""" Benchmark `FrameRange` set algebra.
+
+Compares set arithmetic on fully materialized frames against the
+interval-based FrameRange operators, on million-frame ranges with
+scattered gaps.
+
+Usage: python benchmarks/bench_frame_range_algebra.py
+"""
+import random
+import timeit
+
+from lite_media_core.path_utils.sequence import FrameRange
+
+
+FRAME_COUNT = 1000000
+GAP_COUNT = 10000
+
+
+def _get_frame_range(seed: int) -> FrameRange:
+    """ Build a million-frame range with scattered gaps.
+    """
+    generator = random.Random(seed)
+    missing = generator.sample(range(1, FRAME_COUNT + 1), GAP_COUNT)
+    return FrameRange(1, FRAME_COUNT, missing=missing)
+
+
+def main(number: int = 3):
+    """ Run the benchmark and print results.
+    """
+    expected, rendered = _get_frame_range(1), _get_frame_range(2)
+
+    for label, operation in (
+        ("union", lambda a, b: a | b),
+        ("intersection", lambda a, b: a & b),
+        ("difference", lambda a, b: a - b),
+        ("symmetric_difference", lambda a, b: a ^ b),
+    ):
+        before = timeit.timeit(lambda: operation(set(expected), set(rendered)), number=number)
+        after = timeit.timeit(lambda: operation(expected, rendered), number=number)
+        print(
+            f"{label:<22} before (set) {before / number * 1000:>9.2f} ms"
+            f"    after (FrameRange) {after / number * 1000:>9.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
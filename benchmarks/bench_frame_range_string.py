@@ -0,0 +1,64 @@
+""" Benchmark `FrameRange` string round trips.
+
+Compares the legacy frame-by-frame serializer and set-expanding parser
+against the run-based ones, on dense and sparse ranges.
+
+Usage: python benchmarks/bench_frame_range_string.py
+"""
+import random
+import re
+import timeit
+
+from lite_media_core.path_utils.sequence import FrameRange
+from lite_media_core.path_utils.sequence import _frame_range
+
+
+def _legacy_to_string(frame_range: FrameRange) -> str:
+    """ FrameRange serialization as done before the run-based serializer.
+    """
+    frame_iterator = iter(frame_range)
+    latest = next(frame_iterator)
+    output = "%s" % latest
+
+    for frame in frame_iterator:
+        output += ("-%s" if frame - latest == frame_range.step else ", %s") % frame
+        latest = frame
+
+    return re.sub(r"(\d+)[-\d+]*(-\d+)", r"\1\2" + ("" if frame_range.step == 1 else "x%s" % frame_range.step), output)
+
+
+def _legacy_from_string(str_data: str) -> FrameRange:
+    """ FrameRange parsing as done before the run-based parser.
+    """
+    frames = set()
+    for frame_group in str_data.split(","):
+        match = _frame_range._FRAMERANGE_GROUP_REGEX.match(frame_group.strip(" "))  # pylint: disable=protected-access
+        if match:
+            frames.update(range(int(match.group("start")), int(match.group("end")) + 1))
+        else:
+            frames.add(int(frame_group))
+
+    start, end = min(frames), max(frames)
+    return FrameRange(start=start, end=end, missing=sorted(set(range(start, end)) - frames))
+
+
+def main(number: int = 3):
+    """ Run the benchmark and print results.
+    """
+    generator = random.Random(0)
+    frame_ranges = (
+        ("dense (1M frames, 100 gaps)", FrameRange(1, 1000000, missing=generator.sample(range(1, 1000001), 100))),
+        ("sparse (100k single frames)", FrameRange.from_data(list(range(1, 200000, 2)))),
+    )
+
+    for label, frame_range in frame_ranges:
+        before = timeit.timeit(lambda: _legacy_from_string(_legacy_to_string(frame_range)), number=number)
+        after = timeit.timeit(lambda: FrameRange.from_string(str(frame_range)), number=number)
+        print(
+            f"{label:<30} before {before / number * 1000:>9.2f} ms"
+            f"    after {after / number * 1000:>9.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
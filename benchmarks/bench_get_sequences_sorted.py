@@ -0,0 +1,58 @@
+""" Benchmark sequence detection on a sorted stream of paths.
+
+Compares `path_utils.get_sequences`, which copies the input in sets,
+against `path_utils.get_sequences_sorted` on a sorted stream of 1M paths
+(1000 shots of 1000 frames plus a note per shot).
+Reports the total time and the peak memory.
+
+Usage: python benchmarks/bench_get_sequences_sorted.py
+"""
+import time
+import tracemalloc
+
+from lite_media_core import path_utils
+
+
+SHOT_COUNT = 1000
+FRAMES_PER_SHOT = 1000
+
+
+def _iter_paths():
+    """ Iterate over sorted paths, like the output of `find | LC_ALL=C sort`.
+    """
+    for shot in range(SHOT_COUNT):
+        yield "/farm/shot%04d/notes.txt" % shot
+        for frame in range(1001, 1001 + FRAMES_PER_SHOT):
+            yield "/farm/shot%04d/render/img.%04d.exr" % (shot, frame)
+
+
+def _measure(get_sequences) -> tuple:
+    """ Measure the total time and the peak memory of a detection.
+    Memory is traced in a separate run since tracing slows down the detection.
+    """
+    start = time.perf_counter()
+    count = sum(1 for _ in get_sequences(_iter_paths()))
+    total = time.perf_counter() - start
+
+    tracemalloc.start()
+    for _ in get_sequences(_iter_paths()):
+        pass
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return count, total, peak
+
+
+def main():
+    """ Run the benchmark and print results.
+    """
+    for label, get_sequences in (
+        ("before (get_sequences)", path_utils.get_sequences),
+        ("after (get_sequences_sorted)", path_utils.get_sequences_sorted),
+    ):
+        count, total, peak = _measure(get_sequences)
+        print(f"{label:<30} {count} items    total {total:>6.2f} s    peak {peak / 1024 / 1024:>7.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
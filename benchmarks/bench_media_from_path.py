@@ -0,0 +1,49 @@
+""" Benchmark `Media.from_path` throughput.
+
+Compares the legacy mime-type resolution (re-initializing the standard
+library database on every call) against the cached resolver.
+
+Usage: python benchmarks/bench_media_from_path.py
+"""
+import timeit
+
+from lite_media_core import media
+from lite_media_core.path_utils import mime_types
+
+
+PATHS = [
+    "/path/to/plate/img.%04d.exr" % frame for frame in range(1001, 1101)
+] + ["/path/to/clip.mov", "/path/to/sound.wav", "/path/to/still.png"]
+
+
+def _legacy_guess_type(path: str) -> tuple:
+    """ Mime-type resolution as done before the cached resolver.
+    """
+    mime_types.reload_mimetypes()
+    return mime_types.mimetypes.guess_type(path)
+
+
+def main(number: int = 5):
+    """ Run the benchmark and print results.
+    """
+    for label, guess_type in (
+        ("before (reload_mimetypes)", _legacy_guess_type),
+        ("after (cached resolver)", mime_types.guess_type),
+    ):
+        original = mime_types.guess_type
+        mime_types.guess_type = guess_type
+
+        try:
+            duration = timeit.timeit(
+                lambda: [media.Media.from_path(path) for path in PATHS],
+                number=number,
+            )
+        finally:
+            mime_types.guess_type = original
+
+        calls = number * len(PATHS)
+        print(f"{label:<30} {calls / duration:>12.0f} Media.from_path/s")
+
+
+if __name__ == "__main__":
+    main()
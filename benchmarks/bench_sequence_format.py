@@ -0,0 +1,53 @@
+""" Benchmark `Sequence.format` in a loop.
+
+Compares formatting with cold derived properties (as every call did
+before memoization) against repeated calls on the same Sequence.
+
+Usage: python benchmarks/bench_sequence_format.py
+"""
+import timeit
+
+from lite_media_core.path_utils import sequence
+
+
+FORMATS = (
+    sequence.PredefinedFormat.LEGACY_HASHTAG_EXTENDED,
+    sequence.PredefinedFormat.SPRINTF,
+    sequence.PredefinedFormat.FFMPEG,
+)
+
+
+def _reset(seq: sequence.Sequence):
+    """ Drop the memoized properties of a Sequence.
+    """
+    # pylint: disable=protected-access
+    seq._padding = None
+    seq._frame_range = None
+    seq._missing = None
+    seq._formatted = {}
+
+
+def main(number: int = 2000):
+    """ Run the benchmark and print results.
+    """
+    for frame_count in (100, 10000):
+        seq = sequence.Sequence.from_string("/path/to/plate.%%04d.exr 1-%d" % frame_count)
+
+        def _format(cold: bool):
+            for format_ in FORMATS:
+                if cold:
+                    _reset(seq)
+                seq.format(format_)
+                str(seq)
+
+        before = timeit.timeit(lambda: _format(cold=True), number=number)
+        after = timeit.timeit(lambda: _format(cold=False), number=number)
+        calls = number * len(FORMATS) * 2
+        print(
+            f"{frame_count:>6} frames    before {calls / before:>12.0f} format/s"
+            f"    after {calls / after:>12.0f} format/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
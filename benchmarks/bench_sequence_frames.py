@@ -0,0 +1,99 @@
+""" Benchmark the frame properties of a Sequence found in a list of paths.
+
+Compares the legacy Sequence, answering `padding`, `missing`, `frame_range`
+and `get_frame_path` from the fileseq FrameSet of its FileSequence, against
+the Sequence keeping its own FrameRange, on a sparse sequence of 1M frames
+(runs of 100 frames separated by 50 missing frames).
+Reports the total time, the peak memory and the memory held by the sequence.
+
+Usage: python benchmarks/bench_sequence_frames.py
+"""
+import time
+import tracemalloc
+
+from lite_media_core.path_utils.sequence import Sequence, _frame_range, _utils
+
+
+FRAME_COUNT = 1000000
+LOOKUP_COUNT = 10000
+
+
+def _get_paths() -> list:
+    """ Build the paths of a sparse sequence, runs of 100 frames separated by 50 missing frames.
+    """
+    return ["/farm/shot/img.%07d.exr" % frame for frame in range(FRAME_COUNT * 3 // 2) if frame % 150 < 100]
+
+
+def _legacy_get_frames(fileSeq_sequence) -> tuple:
+    """ Frame properties as answered before the Sequence kept its own FrameRange.
+    """
+    frame_set = fileSeq_sequence.frameSet()
+
+    padding = max(fileSeq_sequence.zfill(), len(str(max(frame_set))))
+    # pylint: disable=protected-access
+    start, end, runs = _frame_range._merge_intervals([(frame, frame) for frame in frame_set], 1)
+    path_template = "%s%%0%dd%s" % (
+        fileSeq_sequence.dirname() + fileSeq_sequence.basename(), fileSeq_sequence.zfill(), fileSeq_sequence.extension()
+    )
+    missing = list(map(path_template.__mod__, _frame_range.FrameRange._from_runs(start, end, runs).missing))
+    frame_range = _frame_range.FrameRange._from_runs(start, end, runs, padding=padding)
+    found = sum(1 for frame in range(1, LOOKUP_COUNT + 1) if frame in frame_set)
+
+    return padding, len(missing), len(frame_range), found
+
+
+def _get_frames(sequence: Sequence) -> tuple:
+    """ Frame properties as answered by the Sequence FrameRange.
+    """
+    found = 0
+    for frame in range(1, LOOKUP_COUNT + 1):
+        try:
+            sequence.get_frame_path(frame)
+        except ValueError:
+            continue
+        found += 1
+
+    return sequence.padding, len(sequence.missing), len(sequence.frame_range), found
+
+
+def _measure(build, get_frames, paths: list) -> tuple:
+    """ Measure the total time and the peak memory of the detection and the frame properties,
+    and the memory held by the detected sequence.
+    Memory is traced in a separate run since tracing slows down the detection.
+    """
+    start = time.perf_counter()
+    result = get_frames(build(paths))
+    total = time.perf_counter() - start
+
+    tracemalloc.start()
+    sequence = build(paths)
+    held = tracemalloc.get_traced_memory()[0]
+    get_frames(sequence)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return result, total, peak, held
+
+
+def main():
+    """ Run the benchmark and print results.
+    """
+    paths = _get_paths()
+    results = set()
+
+    for label, build, get_frames in (
+        ("before (fileseq FrameSet)", lambda data: _utils.find_sequences_in_list(data)[0][0], _legacy_get_frames),
+        ("after (FrameRange)", Sequence.from_list, _get_frames),
+    ):
+        result, total, peak, held = _measure(build, get_frames, paths)
+        results.add(result)
+        print(
+            f"{label:<30} total {total:>6.2f} s    peak {peak / 1024 / 1024:>7.1f} MiB"
+            f"    held {held / 1024 / 1024:>7.1f} MiB"
+        )
+
+    assert len(results) == 1, results
+
+
+if __name__ == "__main__":
+    main()
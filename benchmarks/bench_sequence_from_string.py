@@ -0,0 +1,69 @@
+""" Benchmark `Sequence.from_string` on the strings of a media walk.
+
+Compares the legacy parsing (a fileseq FileSequence built for every string)
+against the pre-check and the cache of parsed strings, on 100k plain file
+paths, which cannot be sequences, and on 100 sequence strings parsed 1000 times.
+
+Usage: python benchmarks/bench_sequence_from_string.py
+"""
+import timeit
+
+import fileseq
+
+from lite_media_core.path_utils.sequence import Sequence, _utils
+
+
+FILE_COUNT = 100000
+SEQUENCE_COUNT = 100
+REPEAT_COUNT = 1000
+
+
+def _legacy_from_string(str_data: str) -> Sequence:
+    """ Parsing as done before the pre-check and the cache of parsed strings.
+    """
+    fileSeq_sequence = fileseq.FileSequence(_utils.conform_path(str_data))
+    if not fileSeq_sequence.frameSet():
+        raise ValueError(f"Path have no frame range information: {str_data}.")
+
+    return Sequence(fileSeq_sequence)
+
+
+def _parse_all(from_string, strings: list) -> int:
+    """ Parse all strings, return the count of sequences.
+    """
+    count = 0
+    for str_data in strings:
+        try:
+            from_string(str_data)
+        except ValueError:
+            continue
+        count += 1
+
+    return count
+
+
+def main():
+    """ Run the benchmark and print results.
+    """
+    for name, strings in (
+        ("plain files", ["/farm/shot%04d/edit/clip_final.mov" % (index % 1000) for index in range(FILE_COUNT)]),
+        (
+            "sequences",
+            ["/farm/shot%04d/render/img.%%04d.exr 1001-1100" % index for index in range(SEQUENCE_COUNT)]
+            * REPEAT_COUNT,
+        ),
+    ):
+        before_count = _parse_all(_legacy_from_string, strings)
+        after_count = _parse_all(Sequence.from_string, strings)
+        assert before_count == after_count, (before_count, after_count)
+
+        before_duration = timeit.timeit(lambda: _parse_all(_legacy_from_string, strings), number=1)
+        after_duration = timeit.timeit(lambda: _parse_all(Sequence.from_string, strings), number=1)
+        print(
+            f"{name:<12} {len(strings):>7} strings    before {before_duration:>6.2f} s"
+            f"    after {after_duration:>6.2f} s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+""" Benchmark `Sequence` frame path generation.
+
+Compares the legacy per-frame path building (fileseq formatting plus
+os.path.abspath) against the precompiled path template, at 1M frames.
+
+Usage: python benchmarks/bench_sequence_paths.py
+"""
+import os
+import timeit
+
+from lite_media_core.path_utils import sequence
+
+
+FRAME_COUNT = 1000000
+
+
+def _legacy_iter_paths(seq: sequence.Sequence) -> list:
+    """ Path generation as done before the path template.
+    """
+    return [os.path.abspath(path) for path in seq._data]  # pylint: disable=protected-access
+
+
+def _legacy_frame_paths(seq: sequence.Sequence, frames: range) -> list:
+    """ Per-frame path lookup as done before the path template.
+    """
+    file_seq_obj = seq._data  # pylint: disable=protected-access
+    paths = []
+    for frame in frames:
+        if frame not in file_seq_obj.frameSet():
+            raise ValueError(f"Invalid frame number: {frame}.")
+        paths.append(os.path.abspath(file_seq_obj.frame(frame)))
+    return paths
+
+
+def main(number: int = 1):
+    """ Run the benchmark and print results.
+    """
+    seq = sequence.Sequence.from_string("/path/to/plate.%%07d.exr 1-%d" % FRAME_COUNT)
+    frames = range(1, FRAME_COUNT + 1, 2)
+
+    for label, count, before, after in (
+        ("iter_paths", FRAME_COUNT, lambda: _legacy_iter_paths(seq), lambda: list(seq.iter_paths())),
+        (
+            "frame_paths (every other frame)",
+            len(frames),
+            lambda: _legacy_frame_paths(seq, frames),
+            lambda: seq.frame_paths(frames),
+        ),
+    ):
+        before_duration = timeit.timeit(before, number=number) / number
+        after_duration = timeit.timeit(after, number=number) / number
+        print(
+            f"{label:<32} before {before_duration:>7.2f} s"
+            f"    after {after_duration:>7.2f} s"
+            f"    ({count / after_duration:>10.0f} paths/s)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,7 @@
 """ lite_media_core
 """
 from lite_media_core.media._audio import Audio
-from lite_media_core.media._image import Image, ImageSequence
+from lite_media_core.media._image import Image, ImageSequence, Sampling, ValidationReport
 from lite_media_core.media._media import Media, UnsupportedMimeType, MediaException
 from lite_media_core.media._video import Movie
 from lite_media_core.media._embedded import EmbeddedVideo, EmbeddedAudio, UnsupportedUrl
@@ -33,6 +33,8 @@ __all__ = [
     "UnsupportedUrl",
     "EmbeddedVideo",
     "EmbeddedAudio",
+    "Sampling",
+    "ValidationReport",
 
     # rate
     "FrameRateException",
@@ -2,7 +2,10 @@
 """
 import os
 
+from typing import Union
+
 from lite_media_core._media_info._base import MediaInfoException
+from lite_media_core._media_info import _headers
 from lite_media_core._media_info import _media_info_api
 
 
@@ -20,3 +23,11 @@ def get_media_information(media_path: str) -> tuple:
 
     except MediaInfoException as error:
         raise ValueError(f"Unsupported provided media: {media_path}.") from error
+
+
+def get_image_resolution(media_path: str) -> Union[tuple, None]:
+    """ Get the (width, height, pixelAspectRatio) of an image by reading its header only.
+
+    :return: The resolution or None if it could not be read from the header.
+    """
+    return _headers.read_resolution(media_path)
@@ -0,0 +1,186 @@
+""" Pure python image header readers.
+
+Read the resolution of common still image formats from their header,
+without loading MediaInfo nor parsing the whole file.
+"""
+import os
+import struct
+
+from typing import BinaryIO, Union
+
+
+# Only the first bytes of the files are read, enough for most headers.
+_HEADER_SIZE = 4096
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+_EXR_MAGIC = b"\x76\x2f\x31\x01"
+_DPX_UNDEFINED = 0xFFFFFFFF
+
+# JPEG start of frame markers (0xC4, 0xC8 and 0xCC are not SOF markers).
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+# TIFF tag -> name, and type -> struct format.
+_TIFF_TAGS = {256: "width", 257: "height"}
+_TIFF_TYPES = {3: "H", 4: "I"}
+
+
+def _read_exr(file_: BinaryIO) -> tuple:
+    """ Read an OpenEXR header: dataWindow and pixelAspectRatio attributes.
+
+    :raise ValueError: When the header cannot be read.
+    """
+    data = file_.read(_HEADER_SIZE)
+    if data[:4] != _EXR_MAGIC:
+        raise ValueError("Not an OpenEXR file.")
+
+    width = height = None
+    pixel_aspect_ratio = 1.0
+    offset = 8  # magic number + version
+
+    while True:
+        name_end = data.index(b"\0", offset)
+        name = data[offset:name_end]
+        if not name:  # end of header
+            break
+
+        type_end = data.index(b"\0", name_end + 1)
+        size, = struct.unpack_from("<i", data, type_end + 1)
+        value_offset = type_end + 5
+
+        if name == b"dataWindow":
+            x_min, y_min, x_max, y_max = struct.unpack_from("<4i", data, value_offset)
+            width, height = x_max - x_min + 1, y_max - y_min + 1
+
+        elif name == b"pixelAspectRatio":
+            pixel_aspect_ratio, = struct.unpack_from("<f", data, value_offset)
+            if width is not None:
+                break
+
+        offset = value_offset + size
+
+    if width is None:
+        raise ValueError("No dataWindow found in OpenEXR header.")
+
+    return width, height, pixel_aspect_ratio
+
+
+def _read_dpx(file_: BinaryIO) -> tuple:
+    """ Read a DPX header: image information and orientation headers.
+
+    :raise ValueError: When the header cannot be read.
+    """
+    data = file_.read(1640)
+    magic = data[:4]
+    if magic == b"SDPX":
+        endian = ">"
+    elif magic == b"XPDS":
+        endian = "<"
+    else:
+        raise ValueError("Not a DPX file.")
+
+    width, height = struct.unpack_from(endian + "2I", data, 772)
+    horizontal, vertical = struct.unpack_from(endian + "2I", data, 1628)
+
+    pixel_aspect_ratio = 1.0
+    if vertical and _DPX_UNDEFINED not in (horizontal, vertical):
+        pixel_aspect_ratio = horizontal / vertical
+
+    return width, height, pixel_aspect_ratio
+
+
+def _read_png(file_: BinaryIO) -> tuple:
+    """ Read a PNG header: IHDR chunk.
+
+    :raise ValueError: When the header cannot be read.
+    """
+    data = file_.read(24)
+    if data[:8] != _PNG_SIGNATURE or data[12:16] != b"IHDR":
+        raise ValueError("Not a PNG file.")
+
+    width, height = struct.unpack_from(">2I", data, 16)
+    return width, height, 1.0
+
+
+def _read_jpeg(file_: BinaryIO) -> tuple:
+    """ Read a JPEG header: first start of frame segment.
+
+    :raise ValueError: When the header cannot be read.
+    """
+    if file_.read(2) != b"\xff\xd8":
+        raise ValueError("Not a JPEG file.")
+
+    while True:
+        marker = file_.read(2)
+        if len(marker) != 2 or marker[0] != 0xFF:
+            raise ValueError("No start of frame found in JPEG file.")
+
+        # Skip padding bytes.
+        while marker[1] == 0xFF:
+            marker = marker[1:] + file_.read(1)
+
+        length, = struct.unpack(">H", file_.read(2))
+
+        if marker[1] in _JPEG_SOF_MARKERS:
+            _, height, width = struct.unpack(">BHH", file_.read(5))
+            return width, height, 1.0
+
+        file_.seek(length - 2, os.SEEK_CUR)
+
+
+def _read_tiff(file_: BinaryIO) -> tuple:
+    """ Read a TIFF header: first image file directory width and length tags.
+
+    :raise ValueError: When the header cannot be read.
+    """
+    data = file_.read(8)
+    if data[:4] == b"II*\0":
+        endian = "<"
+    elif data[:4] == b"MM\0*":
+        endian = ">"
+    else:
+        raise ValueError("Not a TIFF file.")
+
+    ifd_offset, = struct.unpack_from(endian + "I", data, 4)
+    file_.seek(ifd_offset)
+    count, = struct.unpack(endian + "H", file_.read(2))
+    entries = file_.read(count * 12)
+
+    values = {}
+    for index in range(count):
+        tag, type_, _ = struct.unpack_from(endian + "HHI", entries, index * 12)
+        if tag in _TIFF_TAGS and type_ in _TIFF_TYPES:
+            values[_TIFF_TAGS[tag]], = struct.unpack_from(endian + _TIFF_TYPES[type_], entries, index * 12 + 8)
+
+    try:
+        return values["width"], values["height"], 1.0
+    except KeyError as error:
+        raise ValueError("No image size found in TIFF file.") from error
+
+
+_READERS = {
+    ".dpx": _read_dpx,
+    ".exr": _read_exr,
+    ".jpeg": _read_jpeg,
+    ".jpg": _read_jpeg,
+    ".png": _read_png,
+    ".tif": _read_tiff,
+    ".tiff": _read_tiff,
+}
+
+
+def read_resolution(path: str) -> Union[tuple, None]:
+    """ Read the (width, height, pixel aspect ratio) of an image from its header.
+
+    :return: The resolution, or None if the image format is not supported
+        or the header could not be read.
+    """
+    reader = _READERS.get(os.path.splitext(path)[1].lower())
+    if reader is None:
+        return None
+
+    try:
+        with open(path, "rb") as file_:
+            return reader(file_)
+
+    except (OSError, ValueError, struct.error):
+        return None
@@ -1,11 +1,11 @@
 """ Media module.
 """
 from lite_media_core.media._audio import Audio
-from lite_media_core.media._image import Image, ImageSequence
+from lite_media_core.media._image import Image, ImageSequence, Sampling, ValidationReport
 from lite_media_core.media._media import Media, UnsupportedMimeType, MediaException
 from lite_media_core.media._video import Movie
 from lite_media_core.media._embedded import EmbeddedVideo, EmbeddedAudio, UnsupportedUrl
 
 __all__ = ["Audio", "Image", "ImageSequence",
            "Media", "MediaException", "Movie", "UnsupportedMimeType", "UnsupportedUrl",
-           "EmbeddedVideo", "EmbeddedAudio"]
+           "EmbeddedVideo", "EmbeddedAudio", "Sampling", "ValidationReport"]
@@ -1,10 +1,17 @@
 """ Image module.
 """
+import bisect
+import collections.abc
+import concurrent.futures
+import contextlib
 import itertools
-from typing import Union
+import os
+import random
+from typing import Callable, Union
 
 from lite_media_core.path_utils import sequence as _sequence
 
+from lite_media_core import resolution as _resolution
 from lite_media_core.media import _image_media
 from lite_media_core.media import _media
 
@@ -27,15 +34,37 @@ class Image(_image_media.ImageMedia):
                 f"valid types are {self.registered_mime_types}."
             )
 
+        # An image sequence this image belongs to, its information can be reused.
+        self._reference = None
+
+    def _set_media_information(self):
+        """ Helper, will update information and metadata dictionaries.
+        Reuse the reference image sequence information when relevant.
+        """
+        if (
+            not self._info
+            and self._reference is not None
+            and self._reference._shares_information(self._path)  # pylint: disable=protected-access
+        ):
+            self._reference._set_media_information()  # pylint: disable=protected-access
+            self._info, self._metadata = self._reference._info, self._reference._metadata  # pylint: disable=protected-access
+            return
+
+        super()._set_media_information()
+
 
 class ImageSequence(_image_media.ImageMedia, _sequence.Sequence):
     """ Image sequence media.
     """
     registered_mime_types = ("application", "image")
 
-    def __init__(self, path: str, mime_type: str = None):
+    def __init__(self, path: str, mime_type: str = None, inherit_information: bool = True):
         """ Initialize a new ImageSequence object.
 
+        When `inherit_information` is set, images from the sequence reuse the sequence
+        information (resolution, metadata...) unless their size or modification time
+        differ from the sequence first frame. Otherwise each image gathers its own.
+
         :raise ValueError: When the provided path is not a valid image sequence.
         """
         try:
@@ -47,36 +76,110 @@ class ImageSequence(_image_media.ImageMedia, _sequence.Sequence):
         except ValueError as error:
             raise ValueError(f"Incorrect path for sequence: {path}.") from error
 
-        # Compute internal image sequence as media object.
-        self._images = []
-        self._missing = []
-
-        for seq_data, container in zip((seq_path, seq_path.missing), (self._images, self._missing)):
-            for frame_path in seq_data:
-                container.append(Image(frame_path))
-
         # Redirect internal path to first image of the sequence to compute
         # media attributes: resolution, metadata, mimetype...
         _image_media.ImageMedia.__init__(self, seq_path.start, mime_type=mime_type)
 
+        if self.type not in Image.registered_mime_types:
+            raise _media.UnsupportedMimeType(
+                f"Cannot create an Image from {seq_path.start} ({self.type}) "
+                f"valid types are {Image.registered_mime_types}."
+            )
+
         # Keep full sequence path as internal attribute.
-        _sequence.Sequence.__init__(self, seq_path._data)
+        _sequence.Sequence.__init__(self, seq_path)
+
+        # Frames are only stored as the frame range runs, Image objects are created on demand.
+        self._parent = None
+        self._inherit_information = inherit_information
+        self._reference_signature = None
 
     def __iter__(self):
         """ Iterate over the media path(s).
         """
-        for image in self._images:
-            yield image
+        for frame in self._frame_range:
+            yield self._get_image(frame)
 
-    def __getitem__(self, key: int) -> Image:
-        """ Get sequence images per index.
+    def __getitem__(self, key: Union[int, slice]) -> Union[Image, "ImageSequence"]:
+        """ Get sequence images per index, or a sub-sequence per slice.
+
+        :raise IndexError: When the index is out of range or the slice is empty.
         """
-        return self._images[key]
+        if isinstance(key, slice):
+            positions = range(len(self._frame_range))[key]
+            if not positions:
+                raise IndexError(f"Empty slice {key} from {self}.")
+
+            if positions.step < 0:
+                positions = positions[::-1]  # a reversed slice gives a sorted sub-sequence
+
+            return self._sub_sequence(self._frame_range[positions.start:positions.stop:positions.step])
+
+        return self._get_image(self._frame_range[key])
 
     def __len__(self) -> int:
         """ Get sequence length.
         """
-        return len(self._images)
+        return len(self._frame_range)
+
+    def _get_image_path(self, frame: int) -> str:
+        """ Get the absolute path of an image from the sequence.
+        """
+        return self._get_path_template() % frame
+
+    def _get_image(self, frame: int) -> Image:
+        """ Get an Image from the sequence.
+        """
+        image = Image(self._get_image_path(frame), mime_type=self._mime_type)
+
+        if self._inherit_information:
+            image._reference = self._parent or self  # pylint: disable=protected-access
+
+        return image
+
+    def _shares_information(self, path: str) -> bool:
+        """ Can an image from the sequence reuse the sequence information ?
+        True when the image has the same size and modification time as the sequence first frame.
+        """
+        if path == self._path:
+            return True
+
+        if self._reference_signature is None:
+            self._reference_signature = _get_stat_signature(self._path)
+
+        return self._reference_signature is not None and _get_stat_signature(path) == self._reference_signature
+
+    def _get_chunk(self, frames: _sequence.FrameRange) -> Union[Image, "ImageSequence"]:
+        """ Get an Image or an ImageSequence from a subset of the current sequence frames.
+        """
+        if len(frames) == 1:
+            return self._get_image(frames.start)
+
+        return self._sub_sequence(frames)
+
+    def _sub_sequence(self, frames: _sequence.FrameRange) -> "ImageSequence":
+        """ Create a new ImageSequence from a subset of the current sequence frames.
+        The new ImageSequence shares the current media information.
+        """
+        # pylint: disable=protected-access
+        sub_sequence = ImageSequence(
+            _sequence.Sequence._from_frames(self._dirname, self._head, self._zfill, self._tail, frames),
+            mime_type=self._mime_type,
+            inherit_information=self._inherit_information,
+        )
+        sub_sequence._parent = self._parent or self  # pylint: disable=protected-access
+        return sub_sequence
+
+    def _set_media_information(self):
+        """ Helper, will update information and metadata dictionaries.
+        Reuse the parent image sequence information if any.
+        """
+        if self._info or self._parent is None:
+            super()._set_media_information()
+            return
+
+        self._parent._set_media_information()  # pylint: disable=protected-access
+        self._info, self._metadata = self._parent._info, self._parent._metadata  # pylint: disable=protected-access
 
     @property
     def path(self) -> str:
@@ -85,47 +188,97 @@ class ImageSequence(_image_media.ImageMedia, _sequence.Sequence):
         return self.format(_sequence.PredefinedFormat.LEGACY_HASHTAG_EXTENDED)
 
     @property
-    def missing(self) -> list:
+    def missing(self) -> "_ImageList":
         """ The list of the missing images in the sequence.
         """
-        return self._missing
+        return _ImageList(self._frame_range.missing, self._get_path_template(absolute=False).__mod__)
 
-    def validate(self, strict: bool = True) -> bool:
+    @property
+    def frame_range(self) -> _sequence.FrameRange:
+        """ The image sequence frame range.
+        """
+        return self._frame_range
+
+    def validate(
+        self,
+        strict: bool = True,
+        workers: int = None,
+        executor: concurrent.futures.Executor = None,
+        sampling: "Sampling" = None,
+    ) -> "ValidationReport":
         """
         Ensure the sequence is of consistent type,
         Ensure all images have the same resolution.
         Check that it does not mix of existing and missing frames
         (either it exists or it does not).
 
-        Note that this operation can take some time.
+        Existence is checked for every frame from a single directory scan.
+        Resolutions can take some time to check, frames can be probed
+        concurrently by providing an amount of `workers` (thread pool) or
+        an `executor` (e.g. a process pool). When a `sampling` policy is provided,
+        type and resolution are only checked for the sampled frames.
 
-        :raise ValueError: When the sequence is invalid.
+        :return: The validation report, evaluates to False when the sequence is invalid.
+        :raise ValueError: When the sequence is invalid and strict is True, the report (up to the first
+               failure) is attached to the error as `report`.
         """
-        return _validate_sequence(self._images, strict=strict)
+        return _validate_image_sequence(
+            self, sampling=sampling, strict=strict, workers=workers, executor=executor,
+        )
 
     def chunk(self, chunk_size: int) -> list:
         """ Chunk a provided image sequence into a list of smaller image sequence(s).
+        Chunks share the media information already gathered by the image sequence.
 
         :raise ValueError: When the provided chunk size is invalid.
         """
         if not isinstance(chunk_size, int) or chunk_size <= 0:
             raise ValueError(f"Invalid chunk size provided: {chunk_size}.")
 
-        chunk_sequences = []
-        chunk_images = itertools.zip_longest(*[iter(self)] * chunk_size)
+        return [
+            self._get_chunk(self._frame_range[index:index + chunk_size])
+            for index in range(0, len(self._frame_range), chunk_size)
+        ]
 
-        for chunk in chunk_images:
-            chunk = [chunk_bit.path for chunk_bit in chunk if chunk_bit]
+    def partition(self, count: int, by: str = "frames") -> list:
+        """ Partition a provided image sequence into count balanced image sequence(s).
+        Like chunks, single frame partitions are images, and partitions share the
+        media information already gathered by the image sequence.
 
-            if len(chunk) == 1:
-                media_path, = chunk
-            else:
-                sequence = _sequence.Sequence.from_list(list(chunk))
-                media_path = sequence.format(_sequence.PredefinedFormat.LEGACY_HASHTAG_EXTENDED)
+        Partitions are balanced by amount of frames (see `FrameRange.partition`),
+        or by amount of bytes on disk from a single directory scan of the frame sizes.
+        Missing frames count as zero bytes.
+
+        :raise ValueError: When the provided count or balancing mode is invalid.
+        """
+        if not isinstance(count, int) or count <= 0:
+            raise ValueError(f"Invalid partition count provided: {count}.")
+
+        if by == "frames":
+            return [self._get_chunk(unit) for unit in self._frame_range.partition(count)]
+
+        if by != "bytes":
+            raise ValueError(f"Invalid partition mode provided: {by}, expected 'frames' or 'bytes'.")
+
+        sizes = self.scan().sizes
+        offsets = [0] + list(itertools.accumulate(sizes.get(frame, 0) for frame in self._frame_range))
+        if not offsets[-1]:
+            return self.partition(count)
 
-            chunk_sequences.append(_media.Media.from_path(media_path))
+        count = min(count, len(self._frame_range))
+        bounds = [0]
 
-        return chunk_sequences
+        for index in range(1, count):
+            # Closest frame boundary to the ideal amount of bytes,
+            # keeping at least one frame per partition.
+            target = offsets[-1] * index / count
+            bound = bisect.bisect_left(offsets, target)
+            if bound and target - offsets[bound - 1] <= offsets[bound] - target:
+                bound -= 1
+            bounds.append(min(max(bound, bounds[-1] + 1), len(self._frame_range) - count + index))
+
+        bounds.append(len(self._frame_range))
+        return [self._get_chunk(self._frame_range[first:last]) for first, last in zip(bounds, bounds[1:])]
 
     @classmethod
     def from_list(cls, list_data: list) -> Union[Image]:  # pylint: disable=W0221
@@ -137,37 +290,292 @@ class ImageSequence(_image_media.ImageMedia, _sequence.Sequence):
         return cls(_sequence.Sequence.from_list(list_data))
 
 
-def _validate_sequence(image_media_list: list, strict: bool = True) -> bool:
-    """ Validate a list of image media.
+class _ImageList(collections.abc.Sequence):  # pylint: disable=too-many-ancestors
+    """ A read-only list of Image objects built on demand from frame numbers.
+    """
+
+    def __init__(self, frames: collections.abc.Sequence, get_path: Callable[[int], str]):
+        """ Initialize the list from frame numbers and a frame -> path callable.
+        """
+        self._frames = frames
+        self._get_path = get_path
+
+    def __getitem__(self, key: Union[int, slice]) -> Union[Image, "_ImageList"]:
+        """ Get images per index or slice.
+        """
+        if isinstance(key, slice):
+            return _ImageList(self._frames[key], self._get_path)
+
+        return Image(self._get_path(self._frames[key]))
+
+    def __len__(self) -> int:
+        """ The amount of images.
+        """
+        return len(self._frames)
+
+    def __eq__(self, other: object) -> bool:
+        """ Is equal ? (compare as a list of images)
+        """
+        if not isinstance(other, collections.abc.Sequence):
+            return NotImplemented
+
+        return len(self) == len(other) and all(image == item for image, item in zip(self, other))
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        """ The representation of the image list.
+        """
+        return f"<{self.__class__.__name__} {list(self)!r}>"
+
+
+def _get_stat_signature(path: str) -> Union[tuple, None]:
+    """ Get the (size, modification time) of a path, or None if it cannot be reached.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+
+    return stat.st_size, stat.st_mtime_ns
+
+
+class Sampling:
+    """ A frame sampling policy, used to validate only some frames of an ImageSequence.
+
+    Sampling.first_last()
+    Sampling.every(10)
+    Sampling.random(20, seed=0)
+    Sampling.stratified(2, seed=0)
+    """
+
+    def __init__(self, name: str, select: Callable[[_sequence.FrameRange], collections.abc.Iterable]):
+        """ Initialize a sampling policy from a frame range -> frames callable.
+        Prefer the predefined classmethods.
+        """
+        self._name = name
+        self._select = select
+
+    def __repr__(self) -> str:
+        """ The representation of the sampling policy.
+        """
+        return f"<{self.__class__.__name__} {self._name}>"
+
+    def select(self, frame_range: _sequence.FrameRange) -> list:
+        """ Select the sorted frames to sample from a frame range.
+        """
+        return sorted(set(self._select(frame_range)))
+
+    @classmethod
+    def first_last(cls):
+        """ Sample the first and the last frames.
+        """
+        return cls("first_last", lambda frame_range: (frame_range.start, frame_range.end))
+
+    @classmethod
+    def every(cls, step: int):
+        """ Sample every nth frame.
+
+        :raise ValueError: If the step is less than 1.
+        """
+        if not isinstance(step, int) or step < 1:
+            raise ValueError(f"Sampling step {step} must be greater than 0.")
+
+        return cls(f"every={step}", lambda frame_range: frame_range[::step])
+
+    @classmethod
+    def random(cls, count: int, seed: int = None):
+        """ Sample a random amount of frames, reproducible with a seed.
 
-    :raises ValueError: When the current image sequence is not valid.
+        :raise ValueError: If the count is less than 1.
+        """
+        if not isinstance(count, int) or count < 1:
+            raise ValueError(f"Sampling count {count} must be greater than 0.")
+
+        def _select(frame_range: _sequence.FrameRange) -> list:
+            positions = random.Random(seed).sample(range(len(frame_range)), min(count, len(frame_range)))
+            return [frame_range[position] for position in positions]
+
+        return cls(f"random={count} seed={seed}", _select)
+
+    @classmethod
+    def stratified(cls, count: int = 1, seed: int = None):
+        """ Sample a random amount of frames per contiguous sub-range, reproducible with a seed.
+
+        :raise ValueError: If the count is less than 1.
+        """
+        if not isinstance(count, int) or count < 1:
+            raise ValueError(f"Sampling count {count} must be greater than 0.")
+
+        def _select(frame_range: _sequence.FrameRange) -> list:
+            rand = random.Random(seed)
+            frames = []
+            for sub_range in frame_range.iter_ranges():
+                sub_frames = range(sub_range.start, sub_range.end + 1, sub_range.step)
+                frames.extend(rand.sample(sub_frames, min(count, len(sub_frames))))
+            return frames
+
+        return cls(f"stratified={count} seed={seed}", _select)
+
+
+class ValidationReport:
+    """ The result of an image sequence validation.
+    Evaluates to True when the sequence is valid.
     """
+
+    def __init__(self):
+        """ Initialize an empty report.
+        """
+        self.count = 0
+        self.sub_types = set()
+        self.missing = []
+        self.reference_resolution = None
+        self.mismatched_resolutions = {}
+
+    def __bool__(self) -> bool:
+        """ Is the sequence valid ?
+        """
+        return self.valid
+
+    def __repr__(self) -> str:
+        """ The representation of the report.
+        """
+        return f"<{self.__class__.__name__} valid={self.valid} errors={self.errors}>"
+
+    @property
+    def valid(self) -> bool:
+        """ Is the sequence valid ?
+        """
+        return not self.errors
+
+    @property
+    def errors(self) -> list:
+        """ The list of error messages.
+        """
+        errors = []
+
+        if self.count == 0:
+            errors.append("No image in sequence.")
+
+        if len(self.sub_types) > 1:
+            errors.append(f"Inconsistent file type in sequence: {self.sub_types}.")
+
+        if 0 < len(self.missing) < self.count:
+            errors.append(f"Missing frames found in sequence {self.missing}.")
+
+        if self.mismatched_resolutions:
+            resolutions = {self.reference_resolution}.union(self.mismatched_resolutions.values())
+            errors.append(f"Inconsistent resolutions found in sequence: {resolutions}.")
+
+        return errors
+
+    def _raise(self):
+        """ Raise an error with all the errors of the report, the report is attached to it as `report`.
+
+        :raise UnsupportedMimeType: When the sequence mixes file types.
+        :raise ValueError: When the sequence is invalid.
+        """
+        error_type = _media.UnsupportedMimeType if len(self.sub_types) > 1 else ValueError
+        error = error_type(" ".join(self.errors))
+        error.report = self
+
+        raise error
+
+
+def _probe_resolution(image_media: _image_media.ImageMedia) -> tuple:
+    """ Probe an image media resolution.
+    Resolution is returned as a plain (width, height, pixelAspectRatio) tuple so it can be pickled.
+    """
+    image_resolution = image_media.resolution
+    return image_resolution.width, image_resolution.height, image_resolution.pixel_aspect_ratio
+
+
+def _iter_probes(
+    probe: Callable,
+    image_medias: list,
+    workers: int = None,
+    executor: concurrent.futures.Executor = None,
+) -> tuple:
+    """ Yield (image media, probe result) for the provided image medias,
+    in completion order when they are probed concurrently.
+    """
+    if executor is None and not workers:
+        for image_media in image_medias:
+            yield image_media, probe(image_media)
+        return
+
+    pool = executor or concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+    futures = {}
+
     try:
-        # Ensure at least one image in sequence:
-        if not image_media_list:
-            raise ValueError("No image in sequence.")
-
-        # Ensure all images are same mime type.
-        image_types = [image.sub_type for image in image_media_list]
-        if len(set(image_types)) > 1:
-            raise _media.UnsupportedMimeType(f"Inconsistent file type in sequence: {set(image_types)}.")
-
-        # Ensure either all images exist or not.
-        exists = dict((image.path, image.exists) for image in image_media_list)
-        if len(set(exists.values())) != 1:
-            missing_frames = [path for path, exist in exists.items() if not exist]
-            raise ValueError(f"Missing frames found in sequence {missing_frames}.")
-
-        # Validate consistent resolution for existing sequence.
-        if all(exists.values()):
-            resolutions = [image.resolution for image in image_media_list]
-            if len(set(resolutions)) > 1:
-                raise ValueError(f"Inconsistent resolutions found in sequence: {set(resolutions)}.")
-
-    except ValueError:
-        if not strict:
-            return False
-
-        raise
-
-    return True
+        for image_media in image_medias:
+            futures[pool.submit(probe, image_media)] = image_media
+
+        for future in concurrent.futures.as_completed(futures):
+            yield futures[future], future.result()
+
+    finally:
+        # Cancel outstanding work, e.g. on early exit.
+        for future in futures:
+            future.cancel()
+
+        if executor is None:
+            pool.shutdown(wait=True)
+
+
+def _check_resolutions(
+    report: ValidationReport,
+    image_medias: list,
+    strict: bool = True,
+    workers: int = None,
+    executor: concurrent.futures.Executor = None,
+):
+    """ Ensure all image medias have the same resolution, the first one is used as reference.
+    """
+    reference, others = image_medias[0], image_medias[1:]
+    report.reference_resolution = _resolution.Resolution(*_probe_resolution(reference))
+
+    with contextlib.closing(_iter_probes(_probe_resolution, others, workers, executor)) as probes:
+        for image_media, resolution_data in probes:
+            image_resolution = _resolution.Resolution(*resolution_data)
+            if image_resolution != report.reference_resolution:
+                report.mismatched_resolutions[image_media.path] = image_resolution
+
+                if strict:
+                    break
+
+
+def _validate_image_sequence(
+    image_sequence: ImageSequence,
+    sampling: Sampling = None,
+    strict: bool = True,
+    workers: int = None,
+    executor: concurrent.futures.Executor = None,
+) -> ValidationReport:
+    """ Validate an image sequence, existence is checked for every frame from a single directory scan,
+    type and resolution are checked for every frame or only for sampled frames.
+
+    :raises ValueError: When the current image sequence is not valid and strict is True.
+    """
+    report = ValidationReport()
+    report.count = len(image_sequence)
+    report.missing = [
+        image_sequence._get_image_path(frame)  # pylint: disable=protected-access
+        for frame in image_sequence.scan().missing
+    ]
+
+    frames = image_sequence.frame_range
+    if sampling is not None:
+        frames = sampling.select(image_sequence.frame_range)
+
+    images = [Image(image_sequence._get_image_path(frame)) for frame in frames]  # pylint: disable=protected-access
+    report.sub_types = {image.sub_type for image in images}
+
+    # Validate consistent resolution for existing sequence.
+    if report and not report.missing:
+        _check_resolutions(report, images, strict=strict, workers=workers, executor=executor)
+
+    if strict and not report:
+        report._raise()  # pylint: disable=protected-access
+
+    return report
@@ -45,7 +45,13 @@ class ImageMedia(_media.Media):
     @property
     def resolution(self) -> resolution.Resolution:
         """ The media resolution.
+        Read from the image header when supported, fall back to MediaInfo otherwise.
         """
+        if not self._info:
+            header_resolution = _media_info.get_image_resolution(self._path)
+            if header_resolution:
+                return resolution.Resolution(*header_resolution)
+
         self._set_media_information()
         return resolution.Resolution(
             self._info["width"],
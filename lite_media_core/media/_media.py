@@ -28,8 +28,7 @@ class Media:
         self._path = path
 
         if not mime_type:
-            mime_types.reload_mimetypes()
-            self._mime_type = mime_types.mimetypes.guess_type(self._path)[0]
+            self._mime_type = mime_types.guess_type(self._path)[0]
         else:
             self._mime_type = mime_type
 
@@ -127,8 +126,7 @@ class Media:
 
         MEDIA_PER_MIME_TYPES = {"audio": Audio, "image": Image, "video": Movie}
 
-        mime_types.reload_mimetypes()
-        mime_type, _ = mime_types.mimetypes.guess_type(path)
+        mime_type, _ = mime_types.guess_type(path)
         m_type, _ = _conform_mime_type(mime_type)
 
         try:
@@ -145,11 +143,26 @@ class Media:
                 or mime_type is None
             )
         ):
-            return ImageSequence(path)
+            return ImageSequence(seq_path)
 
         media_func = MEDIA_PER_MIME_TYPES.get(m_type, cls._raise_unsupported_media)
         return media_func(path, mime_type=mime_type)
 
+    @classmethod
+    def from_sequence(cls, seq: sequence.Sequence):
+        """ Create and returns a new Media object from a Sequence, without parsing its path again.
+        A single frame sequence is identified from its frame path by `from_path` (ex: "img1.png" is an Image).
+
+        :raise ValueError: When the provided sequence is not supported.
+        """
+
+        from lite_media_core.media._image import ImageSequence  # pylint: disable=C0415
+
+        if seq.has_frame_range and len(seq.frame_range) == 1:
+            return cls.from_path(seq.start)
+
+        return ImageSequence(seq)
+
 
 def _conform_mime_type(mime_type: Union[str, None]) -> tuple:
     """ Conform a provided mime type string.
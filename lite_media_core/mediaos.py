@@ -1,5 +1,7 @@
 """ Mediaos module.
 """
+from typing import Union
+
 import os
 
 from lite_media_core import media
@@ -14,25 +16,20 @@ def walk(top, topdown: bool = True, onerror: bool = None, followlinks: bool = Fa
         file_and_medias = []
         sequences = path_utils.sequence.Sequence.get_sequences(root)
 
-        for sequence in sequences:
-            for file in sequence:
-                files.remove(os.path.basename(file))
-
-        items = sequences + files
+        sequence_files = {os.path.basename(file) for sequence in sequences for file in sequence}
+        items = sequences + [file for file in files if file not in sequence_files]
 
         for item in items:
-            if isinstance(item, path_utils.sequence.Sequence):
-                path = item.format(path_utils.sequence.PredefinedFormat.LEGACY_HASHTAG_EXTENDED)
-            else:
-                path = os.path.join(root, item)
+            if not isinstance(item, path_utils.sequence.Sequence):
+                item = os.path.join(root, item)
 
             # Try to create a media object from file.
             try:
-                file_and_medias.append(media.Media.from_path(path))
+                file_and_medias.append(_get_media(item))
 
             # Not a media, add into file list as a regular file.
             except media.UnsupportedMimeType:
-                file_and_medias.append(os.path.basename(path))
+                file_and_medias.append(os.path.basename(_get_path(item)))
 
         # Yield result for root directory.
         yield root, dirs, file_and_medias
@@ -49,13 +46,8 @@ def identify_from_files(files: list) -> list:
     # Identify potential medias from sequences.
     for item in items:
 
-        if isinstance(item, path_utils.Sequence):
-            path = item.format(path_utils.sequence.PredefinedFormat.LEGACY_HASHTAG_EXTENDED)
-        else:
-            path = str(item)
-
         try:
-            medias.append(media.Media.from_path(path))
+            medias.append(_get_media(item))
 
         except media.UnsupportedMimeType:
             pass  # not a media, ignore.
@@ -80,26 +72,36 @@ def listdir(path: str) -> list:
     # Detect sequences first
     sequences = path_utils.sequence.Sequence.get_sequences(path)
 
-    for sequence in sequences:
-        for file in sequence:
-            base = os.path.basename(file)
-            full = os.path.join(path, base)
-            if full in items:
-                items.remove(full)
+    sequence_files = {os.path.join(path, os.path.basename(file)) for sequence in sequences for file in sequence}
 
     # Merge sequences and remaining files
-    items = sequences + items
+    items = sequences + [item for item in items if item not in sequence_files]
 
     for item in items:
-        if isinstance(item, path_utils.sequence.Sequence):
-            media_path = item.format(path_utils.sequence.PredefinedFormat.LEGACY_HASHTAG_EXTENDED)
-        else:
-            media_path = str(item)
-
         try:
-            file_and_medias.append(media.Media.from_path(media_path))
+            file_and_medias.append(_get_media(item))
 
         except media.UnsupportedMimeType:
-            file_and_medias.append(os.path.basename(media_path))
+            file_and_medias.append(os.path.basename(_get_path(item)))
 
     return file_and_medias
+
+
+def _get_media(item: Union[path_utils.Sequence, str]) -> media.Media:
+    """ Create a media object from a detected Sequence, without formatting and parsing it again, or from a path.
+
+    :raise UnsupportedMimeType: When the item is not a media.
+    """
+    if isinstance(item, path_utils.Sequence):
+        return media.Media.from_sequence(item)
+
+    return media.Media.from_path(str(item))
+
+
+def _get_path(item: Union[path_utils.Sequence, str]) -> str:
+    """ The path of a detected Sequence or of a file.
+    """
+    if isinstance(item, path_utils.Sequence):
+        return item.format(path_utils.sequence.PredefinedFormat.LEGACY_HASHTAG_EXTENDED)
+
+    return str(item)
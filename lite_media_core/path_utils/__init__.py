@@ -2,6 +2,8 @@
 """
 from typing import Union
 
+import collections.abc
+
 from lite_media_core.path_utils.sequence import Sequence, _utils
 from lite_media_core.path_utils.single_file import SingleFile
 
@@ -23,10 +25,33 @@ def get_sequences(data: Union[str, list]) -> list:
     get_sequences(['file.1.ext', 'file.2.ext', 'aa.ext'])
     """
     data = {data} if isinstance(data, str) else set(data)
-    file_seq_objs, remains = _utils.find_sequences_in_list(data)
+    discovered, remains = _utils.discover_sequences_in_list(data)
+
+    yield from _iter_sequences(discovered, remains)
+
+
+def get_sequences_sorted(data: collections.abc.Iterable) -> collections.abc.Iterator:
+    """ Same as `get_sequences` for sorted paths, consumed as a stream.
+    Only the paths of the sequences being resolved are held in memory.
+
+    Paths must be sorted like Python sorts strings, by code point (ex: `sorted(paths)`).
+    Locale collated inputs, like `find | sort` under most locales, are not: use `find | LC_ALL=C sort`
+    (byte order is code point order for UTF-8), or a binary collation for a database cursor
+    (ex: `ORDER BY path COLLATE "C"`).
 
-    for file_seq_obj in file_seq_objs:
-        yield Sequence(file_seq_obj)
+    get_sequences_sorted(['aa.ext', 'file.1.ext', 'file.2.ext'])
+
+    :raises ValueError: If the paths are not sorted by code point.
+    """
+    for discovered, remains in _utils.iter_sequences_in_sorted_list(data):
+        yield from _iter_sequences(discovered, sorted(remains))
+
+
+def _iter_sequences(discovered: list, remains: collections.abc.Iterable) -> collections.abc.Iterator:
+    """ Initialize the Sequence objects from discovered sequences and the paths that are not part of them.
+    """
+    for discovered_sequence in discovered:
+        yield Sequence(discovered_sequence)
 
     for remain in remains:
         try:
@@ -35,4 +60,4 @@ def get_sequences(data: Union[str, list]) -> list:
             yield remain
 
 
-__all__ = ["SingleFile", "Sequence", "from_string", "get_sequences"]
+__all__ = ["SingleFile", "Sequence", "from_string", "get_sequences", "get_sequences_sorted"]
@@ -1,9 +1,15 @@
 """ MimeTypes module.
 
 Usage: look for 'mimetypes' documentation in python standard library.
+
+Internally, lite_media_core resolves mime types through a private
+`mimetypes.MimeTypes` database loaded once (see `guess_type`) rather than
+re-initializing the standard library global database on every lookup.
 """
 import mimetypes as _mimetypes
 import os
+import re
+import threading
 
 
 _ADDITIONAL_MIME_TYPES = os.path.join(
@@ -12,12 +18,88 @@ _ADDITIONAL_MIME_TYPES = os.path.join(
     "additional.mime.types",
 )
 
+_DATABASE = None
+_DATABASE_LOCK = threading.Lock()
+
+# Extension -> (type, encoding) cache, only filled for plain extensions.
+_CACHE = {}
+
+# A plain extension (ex: ".exr"), unlike the ".exr 1-10" extension of a sequence string.
+# Only plain extensions are cached, up to a bounded amount (ex: frame numbers as extensions, "img.1001").
+_PLAIN_EXTENSION_REGEX = re.compile(r"\.\w+")
+_CACHE_SIZE = 1024
+
 
 def reload_mimetypes():
     """ Force reload mimetype to append custom ones.
     """
     _mimetypes.init(files=[_ADDITIONAL_MIME_TYPES])
+    invalidate()
+
+
+def invalidate():
+    """ Drop the private mime types database and its cache.
+    The database will be reloaded on next `guess_type` call.
+    """
+    global _DATABASE  # pylint: disable=global-statement
+
+    with _DATABASE_LOCK:
+        _DATABASE = None
+        _CACHE.clear()
+
+
+def _load_database() -> _mimetypes.MimeTypes:
+    """ Build a new mime types database from system and additional mime types files.
+    """
+    database = _mimetypes.MimeTypes()
+    database.read_windows_registry()
+
+    for path in list(_mimetypes.knownfiles) + [_ADDITIONAL_MIME_TYPES]:
+        if os.path.isfile(path):
+            database.read(path)
+
+    return database
+
+
+def _get_database() -> _mimetypes.MimeTypes:
+    """ Get the private mime types database, load it if needed.
+    """
+    global _DATABASE  # pylint: disable=global-statement
+
+    database = _DATABASE
+    if database is None:
+        with _DATABASE_LOCK:
+            if _DATABASE is None:
+                _DATABASE = _load_database()
+            database = _DATABASE
+
+    return database
+
+
+def guess_type(path: str) -> tuple:
+    """ Guess the (type, encoding) of a provided path.
+    Same as `mimetypes.guess_type` but backed by the lite_media_core database.
+    """
+    database = _get_database()
+    extension = os.path.splitext(path)[1]
+
+    # Compressed or aliased extensions depend on more than the last suffix.
+    if (
+        not _PLAIN_EXTENSION_REGEX.fullmatch(extension)
+        or extension in database.encodings_map
+        or extension in database.suffix_map
+        or path.startswith("data:")
+    ):
+        return database.guess_type(path)
+
+    result = _CACHE.get(extension)
+    if result is None:
+        result = database.guess_type(path)
+        if len(_CACHE) < _CACHE_SIZE:
+            _CACHE[extension] = result
+
+    return result
 
 
-reload_mimetypes()
+_mimetypes.init(files=[_ADDITIONAL_MIME_TYPES])
 mimetypes = _mimetypes
@@ -3,6 +3,7 @@
 from lite_media_core.path_utils.sequence._formats import PredefinedFormat
 from lite_media_core.path_utils.sequence._frame_range import FrameRange
 from lite_media_core.path_utils.sequence._sequence import (
+    ScanResult,
     Sequence,
     SequenceError,
     NoFrameRangeError,
@@ -12,6 +13,7 @@ from lite_media_core.path_utils.sequence._sequence import (
 __all__ = [
     "FrameRange",
     "PredefinedFormat",
+    "ScanResult",
     "Sequence",
     "SequenceError",
     "NoFrameRangeError",
@@ -43,20 +43,19 @@ def format_sequence(sequence: object, predefined_format: PredefinedFormat) -> st
         except KeyError as error:
             raise ValueError(f"Unsupported format: {predefined_format}.") from error
 
-    file_seq_sequence = sequence._data  # pylint: disable=protected-access
     sequence_padding = sequence.padding
-    sequence_start = file_seq_sequence.start()
-    sequence_end = file_seq_sequence.end()
-
-    return file_seq_sequence.format(
-        template.format(
-            zfill=file_seq_sequence.zfill(),
-            padding=sequence_padding,
-            frameRange="%s-%s" % (sequence_start, sequence_end),
-            start=str(sequence_start),
-            startPadded=str(sequence_start).zfill(sequence_padding),
-            end=str(sequence_end),
-            endPadded=str(sequence_end).zfill(sequence_padding),
-            null="",
-        )
+    sequence_start, sequence_end = (
+        (sequence.frame_range.start, sequence.frame_range.end) if sequence.has_frame_range else (0, 0)
     )
+
+    # pylint: disable=protected-access
+    return template.format(
+        zfill=sequence._zfill,
+        padding=sequence_padding,
+        frameRange="%s-%s" % (sequence_start, sequence_end),
+        start=str(sequence_start),
+        startPadded=str(sequence_start).zfill(sequence_padding),
+        end=str(sequence_end),
+        endPadded=str(sequence_end).zfill(sequence_padding),
+        null="",
+    ).format(dirname=sequence._dirname, basename=sequence.head, extension=sequence.tail)
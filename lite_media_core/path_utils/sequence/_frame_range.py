@@ -1,45 +1,250 @@
 """ FrameRange object
 """
-from typing import Union
+from typing import TYPE_CHECKING, Callable, Union
 
+import bisect
 import collections.abc
+import heapq
+import importlib
 import itertools
+import operator
 import re
 
+from importlib import util as _impt_util
+
 import fileseq
 
+if TYPE_CHECKING:
+    import numpy
+
 _FRAMERANGE_GROUP_REGEX = re.compile(r"(?P<start>\-?\d+)\-(?P<end>\-?\d+)(?:x(?P<step>\d+))?")
 
 
+class _FrameList(collections.abc.Sequence):  # pylint: disable=too-few-public-methods
+    """ A read-only list of frames stored as sorted runs of stepped frames.
+    E.g. runs ((1, 5), (21, 25)) with step 2 holds [1, 3, 5, 21, 23, 25].
+    """
+
+    def __init__(self, runs: tuple, step: int):
+        """ Initialize a _FrameList object.
+        """
+        self._runs = runs
+        self._step = step
+
+        # Position of the first frame of each run.
+        self._offsets = []
+        count = 0
+        for first, last in runs:
+            self._offsets.append(count)
+            count += (last - first) // step + 1
+        self._count = count
+
+    def __len__(self) -> int:
+        """ The number of frames.
+        """
+        return self._count
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[int, list]:
+        """ Get a frame (or a list of frames) from its position.
+
+        :raise IndexError: If the position is out of range.
+        """
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(self._count))]
+
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError(f"Frame position {index} out of range.")
+
+        run_index = bisect.bisect_right(self._offsets, index) - 1
+        return self._runs[run_index][0] + (index - self._offsets[run_index]) * self._step
+
+    def __contains__(self, frame: object) -> bool:
+        """ Is the frame part of the list ?
+        """
+        return self._find_run(frame) is not None
+
+    def index(self, frame: object, start: int = 0, stop: int = None) -> int:
+        """ Get the position of a frame, between positions start and stop (excluded).
+
+        :raise ValueError: If the frame is not part of the list.
+        """
+        run_index = self._find_run(frame)
+        if run_index is not None:
+            position = self._offsets[run_index] + (frame - self._runs[run_index][0]) // self._step
+            if position in range(self._count)[start:stop]:
+                return position
+
+        raise ValueError(f"Frame {frame} is not in list.")
+
+    def get_runs(self, start: int, stop: int) -> tuple:
+        """ Get the runs of the frames from position start to position stop (excluded).
+        """
+        if start >= stop:
+            return ()
+
+        first_index = bisect.bisect_right(self._offsets, start) - 1
+        last_index = bisect.bisect_right(self._offsets, stop - 1) - 1
+
+        runs = list(self._runs[first_index:last_index + 1])
+        runs[0] = (runs[0][0] + (start - self._offsets[first_index]) * self._step, runs[0][1])
+        runs[-1] = (runs[-1][0], self._runs[last_index][0] + (stop - 1 - self._offsets[last_index]) * self._step)
+        return tuple(runs)
+
+    def __iter__(self):
+        """ Iterable over the frames.
+
+        :rtype: Generator[int]
+        """
+        for first, last in self._runs:
+            yield from range(first, last + 1, self._step)
+
+    def __reversed__(self):
+        """ Reversed iterable over the frames.
+
+        :rtype: Generator[int]
+        """
+        for first, last in reversed(self._runs):
+            yield from range(last, first - 1, -self._step)
+
+    def __eq__(self, other: object) -> bool:
+        """ Is equal ?
+        """
+        if isinstance(other, _FrameList) and other._step == self._step:
+            return self._runs == other._runs
+
+        if isinstance(other, collections.abc.Sequence) and not isinstance(other, str):
+            return len(other) == self._count and all(frame == item for frame, item in zip(self, other))
+
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        """ The representation of the list, same as a regular list.
+        """
+        return repr(list(self))
+
+    def _find_run(self, frame: object) -> Union[int, None]:
+        """ Find the index of the run containing the provided frame, if any.
+        """
+        if not isinstance(frame, int):
+            return None
+
+        run_index = bisect.bisect_right(self._runs, (frame, float("inf"))) - 1
+        if run_index < 0:
+            return None
+
+        first, last = self._runs[run_index]
+        if frame > last or (frame - first) % self._step:
+            return None
+
+        return run_index
+
+
 class FrameRange:
     """ A FrameRange object.
+
+    Frames are stored as sorted runs of stepped frames, ranges are never
+    expanded frame by frame. FrameRange objects are immutable.
     """
 
+    __slots__ = ("_start", "_end", "_step", "_padding", "_frames", "_hash")
+
     def __init__(
         self,
         start: int,
         end: int,
         padding: Union[int] = None,
-        missing: Union[list] = None,
+        missing: Union[collections.abc.Iterable] = None,
         step: Union[int] = None
     ):  # pylint: disable=too-many-arguments
         """ Initialize a FrameRange object.
         """
-        self._start = start
-        self._end = end
-        self._step = step or 1
-        self._missing = list(missing) if missing else []
-        self._padding = padding or len(str(end))
+        step = step or 1
+        self._initialize(start, end, _get_runs(start, end, step, missing or ()), padding, step)
+
+    def _initialize(
+        self,
+        start: int,
+        end: int,
+        runs: tuple,
+        padding: Union[int],
+        step: int,
+    ):  # pylint: disable=too-many-arguments
+        """ Set the FrameRange attributes, only once as the FrameRange is immutable.
+        """
+        for name, value in (
+            ("_start", start),
+            ("_end", end),
+            ("_step", step),
+            ("_padding", padding or len(str(end))),
+            ("_frames", _FrameList(runs, step)),
+            ("_hash", None),
+        ):
+            object.__setattr__(self, name, value)
+
+    @classmethod
+    def _from_runs(
+        cls,
+        start: int,
+        end: int,
+        runs: tuple,
+        padding: Union[int] = None,
+        step: Union[int] = None,
+    ):  # pylint: disable=too-many-arguments
+        """ Initialize a FrameRange object from already sorted and merged runs.
+        """
+        frame_range = cls.__new__(cls)
+        frame_range._initialize(start, end, runs, padding, step or 1)  # pylint: disable=protected-access
+        return frame_range
+
+    def __setattr__(self, name: str, value: object):
+        """ Prevent attributes from being set.
+
+        :raise AttributeError: FrameRange objects are immutable.
+        """
+        raise AttributeError(f"{self.__class__.__name__} objects are immutable.")
+
+    def __delattr__(self, name: str):
+        """ Prevent attributes from being deleted.
+
+        :raise AttributeError: FrameRange objects are immutable.
+        """
+        raise AttributeError(f"{self.__class__.__name__} objects are immutable.")
+
+    def __reduce__(self) -> tuple:
+        """ Support pickling and copying of the immutable FrameRange.
+        """
+        return self.__class__._from_runs, (self._start, self._end, self._frames._runs, self._padding, self._step)
 
     def __eq__(self, other: object) -> bool:
         """ Is equal ?
+        Compare fields to another FrameRange. A fileseq FrameSet is never equal, as their hashes cannot match.
         """
-        return repr(self) == repr(other)
+        if isinstance(other, FrameRange):
+            # pylint: disable=protected-access
+            return self is other or (hash(self) == hash(other) and self._get_key() == other._get_key())
+
+        # Do not let the FrameSet compare by converting the FrameRange frames.
+        if isinstance(other, fileseq.FrameSet):
+            return False
+
+        return NotImplemented
 
     def __hash__(self) -> int:
-        """ The hash of this FrameRange.
+        """ The hash of this FrameRange, computed once.
+        """
+        if self._hash is None:
+            object.__setattr__(self, "_hash", hash(self._get_key()))
+
+        return self._hash
+
+    def _get_key(self) -> tuple:
+        """ The fields identifying the FrameRange.
         """
-        return hash(self.__repr__())
+        return self._start, self._end, self._padding, self._step, self._frames._runs  # pylint: disable=protected-access
 
     def __repr__(self) -> str:
         """ The representation of the FrameRange.
@@ -50,24 +255,18 @@ class FrameRange:
             self._end,
             self._padding,
             self._step,
-            self._missing,
+            self.missing,
         )
 
     def __str__(self) -> str:
         """ The string representation of the FrameRange's frames.
+        E.g. "1-2, 5, 8-10" or "1-11x5, 21".
         """
-        frame_iterator = iter(self)
-        latest = next(frame_iterator)
-        output = "%s" % latest
-
-        for frame in frame_iterator:
-            output += ("-%s" if frame - latest == self.step else ", %s") % frame
-            latest = frame
-
-        # When building the string, stepped groups are added as "a-b-c-d-e".
-        # For instance, "10-20-30-40-50". This regex strips the middle digits
-        # to just keep "10-50". It adds a step pattern if step is not 1.
-        return re.sub(r"(\d+)[-\d+]*(-\d+)", r"\1\2" + ("" if self.step == 1 else "x%s" % self.step), output)
+        step_suffix = "" if self._step == 1 else "x%s" % self._step
+        return ", ".join(
+            "%s" % first if first == last else "%s-%s%s" % (first, last, step_suffix)
+            for first, last in self._frames._runs  # pylint: disable=protected-access
+        )
 
     def __iter__(self):
         """ Iterable over the frames.
@@ -75,9 +274,56 @@ class FrameRange:
         :return: The frames of the FrameRange.
         :rtype: Generator[int]
         """
-        frames = set(range(self._start, self._end + self._step, self._step)) - set(self._missing)
-        for frame in sorted(frames):
-            yield frame
+        return iter(self._frames)
+
+    def __len__(self) -> int:
+        """ The number of frames in the FrameRange.
+        """
+        return len(self._frames)
+
+    def __contains__(self, frame: object) -> bool:
+        """ Is the frame part of the FrameRange ?
+        """
+        return frame in self._frames
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[int, "FrameRange"]:
+        """ Get a frame from its position, or a FrameRange from a slice of positions.
+
+        :raise IndexError: If the position is out of range.
+        :raise ValueError: If the slice step is less than 1.
+        """
+        if not isinstance(index, slice):
+            return self._frames[index]
+
+        start, stop, step = index.indices(len(self))
+        if step < 1:
+            raise ValueError(f"Slice step {step} must be greater than 0.")
+
+        runs = self._frames.get_runs(start, stop)
+        frame_step = self._step
+
+        if step > 1 and len(runs) == 1:
+            first, last = runs[0]
+            frame_step = self._step * step
+            runs = ((first, _get_last_frame(first, last, frame_step)),)
+
+        elif step > 1 and runs:
+            runs = _merge_intervals(
+                [(frame, frame) for frame in itertools.islice(_FrameList(runs, self._step), 0, None, step)], 1,
+            )[2]
+            frame_step = 1
+
+        if not runs:
+            return FrameRange._from_runs(self._start, self._start, runs, padding=self._padding, step=frame_step)
+
+        return FrameRange._from_runs(runs[0][0], runs[-1][1], runs, padding=self._padding, step=frame_step)
+
+    def index(self, frame: int) -> int:
+        """ Get the position of a frame in the FrameRange.
+
+        :raise ValueError: If the frame is not part of the FrameRange.
+        """
+        return self._frames.index(frame)
 
     def chunks(self, chunk_size: int) -> list:
         """ Yield successive chunk_size-sized tuples of frames.
@@ -94,26 +340,142 @@ class FrameRange:
             yield chunk
             chunk = tuple(itertools.islice(iterator, chunk_size))
 
+    def partition(self, count: int, respect_gaps: bool = False, interleave: bool = False) -> list:
+        """ Split the FrameRange into count nearly equal FrameRange work units.
+        No unit is empty, so fewer units are returned when there are less frames than count.
+
+        By default, units are consecutive slices of frames whose sizes differ by one frame at most.
+
+        :param respect_gaps: Never span a gap: units are split inside each sub-range
+            (see `iter_ranges`), which gets a share of count proportional to its size.
+            There is at least one unit per sub-range.
+        :param interleave: Unit i gets every count-th frame from the i-th frame,
+            e.g. for progressive previews.
+        :raise ValueError: If count is less than 1, or if both respect_gaps and interleave are set.
+        """
+        if not isinstance(count, int) or count < 1:
+            raise ValueError(f"Partition count {count} must be greater than 0.")
+
+        if respect_gaps and interleave:
+            raise ValueError("Interleaved partitions cannot respect gaps.")
+
+        total = len(self)
+        count = min(count, total)
+
+        if not count:
+            return []
+
+        if interleave:
+            return [self[index::count] for index in range(count)]
+
+        if respect_gaps:
+            sub_ranges = list(self.iter_ranges())
+            if len(sub_ranges) > 1:
+                units = []
+                for sub_range, sub_count in zip(sub_ranges, _apportion([len(sub) for sub in sub_ranges], count)):
+                    units.extend(sub_range.partition(sub_count))
+                return units
+
+        bounds = [total * index // count for index in range(count + 1)]
+        return [self[first:last] for first, last in zip(bounds, bounds[1:])]
+
+    def to_numpy(self) -> "numpy.ndarray":
+        """ Get the frames as a numpy int64 array, computed from the runs.
+
+        :raise RuntimeError: When numpy is not available.
+        """
+        numpy = _import_numpy()
+        runs = numpy.array(self._frames._runs, dtype=numpy.int64).reshape(-1, 2)  # pylint: disable=protected-access
+        counts = (runs[:, 1] - runs[:, 0]) // self._step + 1
+
+        # The frame at position p of a run is (first - offset * step) + p * step.
+        offsets = numpy.cumsum(counts) - counts
+        origins = numpy.repeat(runs[:, 0] - offsets * self._step, counts)
+        return origins + numpy.arange(origins.size, dtype=numpy.int64) * self._step
+
     def iter_ranges(self) -> list:
         """ Yield sub-ranges.
         E.g. (10-14, 17-20) yields (10-14), (17-20)
         """
-        if not self._missing:
+        runs = self._frames._runs  # pylint: disable=protected-access
+        if runs == ((self._start, _get_last_frame(self._start, self._end, self._step)),):
             yield self
 
         else:
-            all_frames = list(self)
-            first = all_frames.pop(0)
-            previous = first
-            current = None
-            for current in all_frames:
-                if current - previous != self._step:
-                    yield FrameRange(first, previous, padding=self._padding, step=self._step)
-                    first = current
+            for first, last in runs:
+                yield FrameRange(first, last, padding=self._padding, step=self._step)
+
+    def union(self, other: object) -> "FrameRange":
+        """ Get the frames in this FrameRange or in some other frame data.
+        """
+        return self._combine(other, operator.or_)
+
+    def intersection(self, other: object) -> "FrameRange":
+        """ Get the frames in both this FrameRange and some other frame data.
+        """
+        return self._combine(other, operator.and_)
+
+    def difference(self, other: object) -> "FrameRange":
+        """ Get the frames in this FrameRange but not in some other frame data.
+        """
+        return self._combine(other, _and_not)
+
+    def symmetric_difference(self, other: object) -> "FrameRange":
+        """ Get the frames either in this FrameRange or in some other frame data, but not in both.
+        """
+        return self._combine(other, operator.xor)
+
+    def __or__(self, other: object) -> "FrameRange":
+        """ Union of two FrameRange objects.
+        """
+        return self.union(other) if isinstance(other, FrameRange) else NotImplemented
+
+    def __and__(self, other: object) -> "FrameRange":
+        """ Intersection of two FrameRange objects.
+        """
+        return self.intersection(other) if isinstance(other, FrameRange) else NotImplemented
+
+    def __sub__(self, other: object) -> "FrameRange":
+        """ Difference of two FrameRange objects.
+        """
+        return self.difference(other) if isinstance(other, FrameRange) else NotImplemented
+
+    def __xor__(self, other: object) -> "FrameRange":
+        """ Symmetric difference of two FrameRange objects.
+        """
+        return self.symmetric_difference(other) if isinstance(other, FrameRange) else NotImplemented
+
+    def _combine(self, other: object, keep: Callable[[bool, bool], bool]) -> "FrameRange":
+        """ Combine the frames of this FrameRange with some other frame data.
+        The result keeps the step if both share the same stepped frames,
+        otherwise its step is 1. Its padding is the largest one.
+
+        :param keep: Whether a frame is kept, from its presence in both FrameRange objects.
+        :raises ValueError: If the other frame data is invalid
+        """
+        if not isinstance(other, FrameRange):
+            other = FrameRange.from_data(other)
+
+        # pylint: disable=protected-access
+        runs, other_runs = self._frames._runs, other._frames._runs
+        padding = max(self._padding, other._padding)
+
+        if self._step == other._step and (self._start - other._start) % self._step == 0:
+            step, origin = self._step, self._start
+        else:
+            step, origin = 1, 0
+            runs, other_runs = _split_runs(runs, self._step), _split_runs(other_runs, other._step)
+
+        # Runs are combined as contiguous intervals of frame indexes, from origin.
+        intervals = _combine_intervals(
+            _to_indexes(runs, origin, step), _to_indexes(other_runs, origin, step), keep,
+        )
+        runs = tuple((origin + first * step, origin + last * step) for first, last in intervals)
 
-                previous = current
+        if not runs:
+            return FrameRange._from_runs(self._start, self._start, runs, padding=padding, step=step)
 
-            yield FrameRange(first, current, padding=self._padding, step=self._step)
+        return FrameRange._from_runs(runs[0][0], runs[-1][1], runs, padding=padding, step=step)
 
     @property
     def start(self) -> int:
@@ -140,10 +502,13 @@ class FrameRange:
         return self._step
 
     @property
-    def missing(self) -> list:
+    def missing(self) -> _FrameList:
         """ The list of missing frames.
+        A read-only sequence computed from the runs, not a `list`: it supports `len`, `in`, indexing,
+        iteration and comparison to lists, use `list(frame_range.missing)` to modify or serialize it.
         """
-        return self._missing.copy()
+        runs = self._frames._runs  # pylint: disable=protected-access
+        return _FrameList(_get_gaps(self._start, self._end, self._step, runs), self._step)
 
     @classmethod
     def from_string(cls, str_data: str):
@@ -152,7 +517,7 @@ class FrameRange:
         :raise ValueError: If strData is not a valid string,
                or if multiple different steps are provided in strData.
         """
-        frames = set()
+        intervals = []
         steps = set()
 
         # Sanity check
@@ -165,9 +530,10 @@ class FrameRange:
                 frame_start_str, frame_end_str, frame_set_str = match.groups()
                 if frame_set_str:
                     steps.add(int(frame_set_str))
-                frames.update(range(int(frame_start_str), int(frame_end_str) + 1))
+                intervals.append((int(frame_start_str), int(frame_end_str)))
             else:
-                frames.add(int(frame_group))
+                frame = int(frame_group)
+                intervals.append((frame, frame))
 
         # Step management
         if len(steps) > 1:
@@ -177,45 +543,289 @@ class FrameRange:
         else:
             step = 1
 
-        # Discover missing frames
-        start, end = min(frames), max(frames)
-        missing_frames = set(range(start, end, step)) - frames
-        return cls(start=start, end=end, step=step, missing=sorted(missing_frames))
+        start, end, runs = _merge_intervals(intervals, step)
+        return cls._from_runs(start, end, runs, step=step)
+
+    @classmethod
+    def from_numpy(cls, frames: "numpy.ndarray", padding: Union[int] = None, step: Union[int] = None):
+        """ Initialize a FrameRange object from a numpy array of frames.
+        Frames are sorted and deduplicated, and stepped from the lowest frame.
+
+        :raise RuntimeError: When numpy is not available.
+        :raises ValueError: If there's no frame, or if a frame is not a multiple of step from the lowest frame.
+        """
+        numpy = _import_numpy()
+        step = step or 1
+        frames = numpy.sort(numpy.asarray(frames, dtype=numpy.int64), axis=None)
+        if not frames.size:
+            raise ValueError("No frame found.")
+
+        frames = frames[numpy.concatenate(([True], numpy.diff(frames) != 0))]
+
+        indexes, remainders = numpy.divmod(frames - frames[0], step)
+        if remainders.any():
+            raise ValueError(f"Frames {frames[remainders != 0][:5].tolist()} do not match step {step}.")
+
+        # Runs break where consecutive frames are more than one step apart.
+        breaks = numpy.flatnonzero(numpy.diff(indexes) != 1)
+        firsts = frames[numpy.concatenate(([0], breaks + 1))]
+        lasts = frames[numpy.concatenate((breaks, [-1]))]
+        runs = tuple(zip(firsts.tolist(), lasts.tolist()))
+
+        return cls._from_runs(runs[0][0], runs[-1][1], runs, padding=padding, step=step)
+
+    @classmethod
+    def _from_sorted_frames(cls, frames: collections.abc.Sequence, padding: Union[int] = None):
+        """ Initialize a FrameRange object from some already sorted and unique frames.
+        """
+        runs = _get_consecutive_runs(frames)
+        return cls._from_runs(runs[0][0], runs[-1][1], runs, padding=padding)
 
     @classmethod
     def from_data(
         cls,
-        *frames: Union[str, int, fileseq.FrameSet, collections.abc.Sequence]
+        *frames: Union[str, int, fileseq.FrameSet, collections.abc.Sequence],
+        padding: Union[int] = None
     ):
         """ Initialize a FrameRange object from some frame data.
 
         :raises ValueError: If the provided value is invalid
         """
-        frames = _conform_to_frames(frames)
-        min_frame = min(frames)
-        max_frame = max(frames)
-        missing_frames = list(set(range(min_frame, max_frame + 1)) - frames)
-        return cls(start=min_frame, end=max_frame, missing=missing_frames)
+        start, end, runs = _merge_intervals(_conform_to_intervals(frames), 1)
+        return cls._from_runs(start, end, runs, padding=padding)
+
+
+def _import_numpy():
+    """ Import numpy, only required for array conversions.
+
+    :raise RuntimeError: When numpy is not available.
+    """
+    # Ensure lite_media_core was installed with the
+    # "numpy" extra requires.
+    if not _impt_util.find_spec("numpy"):
+        raise RuntimeError(
+            "Cannot convert frames to or from numpy arrays, ensure that "
+            "lite_media_core is installed with the 'numpy' extra requires."
+        )
+
+    return importlib.import_module("numpy")
+
+
+def _apportion(sizes: list, count: int) -> list:
+    """ Share count units between some sizes, so that the size per unit is balanced.
+    Each size gets at least one unit and at most one unit per item.
+    """
+    total = sum(sizes)
+    counts = [min(size, max(1, size * count // total)) for size in sizes]
+
+    # Give the remaining units to the largest sizes per unit.
+    heap = [(-size / size_count, index) for index, (size, size_count) in enumerate(zip(sizes, counts))]
+    heapq.heapify(heap)
+
+    for _ in range(count - sum(counts)):
+        if not heap:
+            break
 
+        _, index = heapq.heappop(heap)
+        counts[index] += 1
+        if counts[index] < sizes[index]:
+            heapq.heappush(heap, (-sizes[index] / counts[index], index))
 
-def _conform_to_frames(value: object) -> set:
-    """ Conform some data to a list of frames.
+    return counts
+
+
+def _get_last_frame(start: int, end: int, step: int) -> int:
+    """ Get the last stepped frame, from start, not greater than end.
+    """
+    return end - (end - start) % step
+
+
+def _get_runs(start: int, end: int, step: int, missing: collections.abc.Iterable) -> tuple:
+    """ Get the runs of the stepped frames from start to end, minus the missing ones.
+    """
+    last_frame = _get_last_frame(start, end, step)
+    runs = []
+    first = start
+
+    for frame in sorted(missing):
+        if frame < first or frame > last_frame or (frame - start) % step:
+            continue  # duplicate, out of range or off step
+
+        if frame > first:
+            runs.append((first, frame - step))
+        first = frame + step
+
+    if first <= last_frame:
+        runs.append((first, last_frame))
+
+    return tuple(runs)
+
+
+def _get_gaps(start: int, end: int, step: int, runs: tuple) -> tuple:
+    """ Get the runs of the stepped frames from start to end not covered by some runs.
+    """
+    gaps = []
+    first = start
+
+    for run_first, run_last in runs:
+        if run_first > first:
+            gaps.append((first, run_first - step))
+        first = run_last + step
+
+    last_frame = _get_last_frame(start, end, step)
+    if first <= last_frame:
+        gaps.append((first, last_frame))
+
+    return tuple(gaps)
+
+
+def _get_consecutive_runs(frames: collections.abc.Sequence) -> tuple:
+    """ Get the runs of consecutive frames from some sorted and unique frames.
+    Within a run, frame - position is constant: each run end is found by galloping instead of frame by frame.
+
+    :raises ValueError: If there's no frame.
+    """
+    count = len(frames)
+    if not count:
+        raise ValueError("No frame found.")
+
+    runs = []
+    first_index = 0
+
+    while first_index < count:
+        first = frames[first_index]
+        if first_index + 1 == count or frames[first_index + 1] != first + 1:
+            runs.append((first, first))  # isolated frame, no need to gallop
+            first_index += 1
+            continue
+
+        offset = first - first_index
+
+        # Double the run length while it holds, then bisect the last doubling.
+        length = 1
+        while first_index + length < count and frames[first_index + length] - offset == first_index + length:
+            length *= 2
+
+        low, high = first_index + length // 2 + 1, min(first_index + length, count)
+        while low < high:
+            middle = (low + high) // 2
+            if frames[middle] - offset == middle:
+                low = middle + 1
+            else:
+                high = middle
+
+        runs.append((first, frames[low - 1]))
+        first_index = low
+
+    return tuple(runs)
+
+
+def _and_not(value_a: bool, value_b: bool) -> bool:
+    """ Is value_a true but not value_b ?
+    """
+    return value_a and not value_b
+
+
+def _split_runs(runs: tuple, step: int) -> tuple:
+    """ Split some stepped runs into single frame runs, if they have a step.
+    """
+    if step == 1:
+        return runs
+
+    return tuple((frame, frame) for first, last in runs for frame in range(first, last + 1, step))
+
+
+def _to_indexes(runs: tuple, origin: int, step: int) -> tuple:
+    """ Convert some stepped runs to intervals of frame indexes, from origin.
+    """
+    if step == 1 and origin == 0:
+        return runs
+
+    return tuple(((first - origin) // step, (last - origin) // step) for first, last in runs)
+
+
+def _combine_intervals(intervals_a: tuple, intervals_b: tuple, keep: Callable[[bool, bool], bool]) -> list:
+    """ Combine two lists of sorted, disjoint and inclusive (first, last) intervals.
+
+    :param keep: Whether a value is kept, from its presence in both interval lists.
+    """
+    # Each interval bound toggles the presence in its interval list.
+    bounds = heapq.merge(
+        ((bound, 0) for first, last in intervals_a for bound in (first, last + 1)),
+        ((bound, 1) for first, last in intervals_b for bound in (first, last + 1)),
+    )
+    inside = [False, False]
+    result = []
+    first = None
+
+    for position, position_bounds in itertools.groupby(bounds, key=operator.itemgetter(0)):
+        for _, index in position_bounds:
+            inside[index] = not inside[index]
+
+        if keep(*inside):
+            if first is None:
+                first = position
+
+        elif first is not None:
+            result.append((first, position - 1))
+            first = None
+
+    return result
+
+
+def _merge_intervals(intervals: list, step: int) -> tuple:
+    """ Merge some inclusive (first, last) frame intervals into stepped runs.
+    Frames are stepped from the lowest frame.
+
+    :return: The start, end and runs of the intervals.
+    :raises ValueError: If there's no frame in the intervals.
+    """
+    intervals = sorted(interval for interval in intervals if interval[0] <= interval[1])
+    if not intervals:
+        raise ValueError("No frame found.")
+
+    start = intervals[0][0]
+    end = max(last for _, last in intervals)
+    runs = []
+
+    for first, last in intervals:
+        first += (start - first) % step
+        last = _get_last_frame(start, last, step)
+        if first > last:
+            continue
+
+        if runs and first <= runs[-1][1] + step:
+            if last > runs[-1][1]:
+                runs[-1] = (runs[-1][0], last)
+        else:
+            runs.append((first, last))
+
+    return start, end, tuple(runs)
+
+
+def _conform_to_intervals(value: object) -> list:
+    """ Conform some data to a list of inclusive (first, last) frame intervals.
 
     :raises ValueError: If the provided value is invalid
     """
     if isinstance(value, int):
-        return {value}
+        return [(value, value)]
 
     if isinstance(value, str):
-        return set(FrameRange.from_string(value))
+        value = FrameRange.from_string(value)
+
+    if isinstance(value, FrameRange):
+        if value.step == 1:
+            return list(value._frames._runs)  # pylint: disable=protected-access
+        return [(frame, frame) for frame in value]
 
-    if isinstance(value, (FrameRange, fileseq.FrameSet)):
-        return set(value)
+    if isinstance(value, fileseq.FrameSet):
+        return list(_get_consecutive_runs(sorted(value.items))) if value else []
 
     if isinstance(value, collections.abc.Sequence):  # pylint: disable=no-member
-        result = set()
+        result = []
         for val in value:
-            result.update(_conform_to_frames(val))
+            result.extend(_conform_to_intervals(val))
         return result
 
     raise ValueError(f"Unsupported frame format {type(value).__name__}: {value}.")
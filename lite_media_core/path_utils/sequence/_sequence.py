@@ -1,7 +1,9 @@
 """ Sequence object.
 """
-from typing import Union
+from typing import TYPE_CHECKING, Union
 
+import collections.abc
+import functools
 import os
 import fileseq
 
@@ -9,6 +11,9 @@ from lite_media_core.path_utils.sequence import _formats
 from lite_media_core.path_utils.sequence import _frame_range
 from lite_media_core.path_utils.sequence import _utils
 
+if TYPE_CHECKING:
+    import numpy
+
 
 class SequenceError(Exception):
     """ Base exception for sequence.
@@ -20,64 +25,281 @@ class NoFrameRangeError(SequenceError):
     """
 
 
+# When listing a sequence directory, fall back to per-frame stats
+# once the listing is that many times larger than the sequence.
+_SCAN_MAX_RATIO = 4
+_SCAN_MIN_ENTRIES = 1000
+
+# Number of parsed sequence strings kept by `Sequence.from_string`.
+_PARSE_CACHE_SIZE = 4096
+
+
+def _get_shortest_frame_length(frame_range: _frame_range.FrameRange) -> int:
+    """ Get the length of the shortest frame string, from the frames closest to zero.
+    """
+    if frame_range.start >= 0:
+        return len(str(frame_range.start))
+
+    lengths = []
+    for sub_range in frame_range.iter_ranges():
+        if sub_range.start <= 0 <= sub_range.end:
+            return 1
+
+        lengths.append(min(len(str(sub_range.start)), len(str(sub_range.end))))
+
+    return min(lengths)
+
+
+def _get_frame_range(frames: collections.abc.Sequence, zfill: int) -> Union[_frame_range.FrameRange, None]:
+    """ Get the FrameRange of some sorted and unique frames, with the padding of the Sequence paths.
+    None if there's no frame.
+    """
+    if not frames:
+        return None
+
+    padding = max(zfill, len(str(frames[-1])))
+
+    # pylint: disable=protected-access
+    if isinstance(frames, _frame_range.FrameRange) and frames.step == 1:
+        return _frame_range.FrameRange._from_runs(frames.start, frames.end, frames._frames._runs, padding=padding)
+
+    return _frame_range.FrameRange._from_sorted_frames(frames, padding=padding)
+
+
+def _get_fileSeq_components(file_seq_obj: fileseq.FileSequence) -> tuple:
+    """ Get the (dirname, head, zfill, tail, frame range, fileseq frame range string, padding characters)
+    of a fileseq sequence.
+
+    :raise ValueError: When the fileseq sequence has no frame information.
+    """
+    try:
+        _utils.validate_file_sequence(file_seq_obj)
+
+    except ValueError as error:
+        raise ValueError("Cannot initialize a Sequence from %r: %s" % (file_seq_obj, error)) from error
+
+    frame_set = file_seq_obj.frameSet()
+    return (
+        file_seq_obj.dirname(),
+        file_seq_obj.basename(),
+        file_seq_obj.zfill(),
+        file_seq_obj.extension(),
+        _get_frame_range(sorted(frame_set.items), file_seq_obj.zfill()),
+        str(frame_set),
+        file_seq_obj.padding(),
+    )
+
+
+@functools.lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _parse_sequence_string(str_data: str) -> tuple:
+    """ Parse a sequence string into Sequence components, see `_get_fileSeq_components`.
+    Components are immutable, so they are cached: the same string is only parsed once.
+
+    :raise ValueError: When the provided string could not be uncompressed as a Sequence.
+    """
+    return _get_fileSeq_components(fileseq.FileSequence(_utils.conform_path(str_data)))
+
+
+class ScanResult:
+    """ The on-disk state of a Sequence frames, gathered by `Sequence.scan`.
+    """
+
+    def __init__(self, stats: dict, missing: list):
+        """ Initialize a ScanResult from {frame: os.stat_result} and the missing frames.
+        """
+        self.stats = stats
+        self.missing = missing
+
+    def __repr__(self) -> str:
+        """ The representation of the ScanResult.
+        """
+        return (
+            f"<{self.__class__.__name__} present={len(self.stats)} "
+            f"missing={len(self.missing)} empty={len(self.empty)}>"
+        )
+
+    @property
+    def present(self) -> list:
+        """ The sorted list of frames found on disk.
+        """
+        return sorted(self.stats)
+
+    @property
+    def empty(self) -> list:
+        """ The sorted list of zero-byte frames found on disk.
+        """
+        return sorted(frame for frame, stat in self.stats.items() if stat.st_size == 0)
+
+    @property
+    def sizes(self) -> dict:
+        """ The size in bytes per frame found on disk.
+        """
+        return {frame: stat.st_size for frame, stat in self.stats.items()}
+
+
 class Sequence:
     """ A Sequence object.
     """
 
-    def __init__(self, file_seq_obj: Union[fileseq.FileSequence]):
-        """ Initialize a Sequence from a fileSeq object.
+    def __init__(self, file_seq_obj: Union[fileseq.FileSequence, _utils.DiscoveredSequence]):
+        """ Initialize a Sequence from a fileSeq object, a discovered sequence or another Sequence.
+
+        The frames are kept as a FrameRange, no fileseq object is built unless `_data` is accessed.
 
         :raise ValueError: When the provided reference object is not a fileseq.FileSequence object
             or if the sequence object has no padding.
         """
-        if not isinstance(file_seq_obj, (Sequence, fileseq.FileSequence)):
+        if isinstance(file_seq_obj, Sequence):
+            self._initialize(
+                file_seq_obj._dirname,
+                file_seq_obj._head,
+                file_seq_obj._zfill,
+                file_seq_obj._tail,
+                file_seq_obj._frame_range,
+                file_seq_obj._frange,
+                file_seq_obj._padding_chars,
+            )
+            self._file_seq = file_seq_obj._file_seq
+
+        elif isinstance(file_seq_obj, _utils.DiscoveredSequence):
+            self._initialize(
+                file_seq_obj.dirname,
+                file_seq_obj.head,
+                file_seq_obj.zfill,
+                file_seq_obj.tail,
+                _get_frame_range(file_seq_obj.frames, file_seq_obj.zfill),
+                file_seq_obj.frange,
+            )
+
+        elif isinstance(file_seq_obj, fileseq.FileSequence):
+            self._initialize(*_get_fileSeq_components(file_seq_obj))
+            self._file_seq = file_seq_obj
+
+        else:
             raise ValueError("Cannot initialize a Sequence from %r." % file_seq_obj)
 
-        if isinstance(file_seq_obj, Sequence):
-            file_seq_obj = file_seq_obj._data
+    def _initialize(
+        self,
+        dirname: str,
+        head: str,
+        zfill: int,
+        tail: str,
+        frame_range: Union[_frame_range.FrameRange, None],
+        frange: Union[str, None] = None,
+        padding_chars: Union[str, None] = None,
+    ):  # pylint: disable=too-many-arguments
+        """ Set the Sequence components, its frames are answered from the frame range.
+        The fileseq frame range string (for the representation and `_data`) is computed on demand if not provided,
+        the fileseq padding characters are resolved from zfill if not provided.
+        """
+        self._dirname = dirname
+        self._head = head
+        self._zfill = zfill
+        self._tail = tail
+        self._frame_range = frame_range
+        self._frange = frange
+        self._padding_chars = fileseq.FileSequence.getPaddingChars(zfill) if padding_chars is None else padding_chars
+        self._file_seq = None
+
+        self._has_frame_range = frame_range is not None
+        self._single_frame = self._has_frame_range and len(frame_range) == 1
+        self._padding = frame_range.padding if self._has_frame_range else max(zfill, 1)
+
+        # Sequences are immutable, derived properties are computed on first access.
+        self._missing = None
+        self._formatted = {}
+        self._key = None
+        self._hash = None
+        self._path_templates = {}
 
-        try:
-            _utils.validate_file_sequence(file_seq_obj)
+    @classmethod
+    def _from_frames(
+        cls, dirname: str, head: str, zfill: int, tail: str, frames: collections.abc.Sequence
+    ):  # pylint: disable=too-many-arguments
+        """ Initialize a Sequence from its components and some sorted and unique frames.
+        """
+        sequence = cls.__new__(cls)
+        # pylint: disable=protected-access
+        sequence._initialize(dirname, head, zfill, tail, _get_frame_range(frames, zfill))
+        return sequence
 
-        except ValueError as error:
-            raise ValueError("Cannot initialize a Sequence from %r: %s" % (file_seq_obj, error)) from error
+    @property
+    def _data(self) -> fileseq.FileSequence:
+        """ The fileseq sequence, only built on demand.
+        """
+        if self._file_seq is None:
+            self._file_seq = _utils.build_fileSeq_sequence(
+                self._dirname, self._head, self._padding_chars, self._tail, fileseq.FrameSet(self._get_frange())
+            )
+
+        return self._file_seq
 
-        self._single_frame = len(file_seq_obj.frameSet()) == 1
-        self._data = file_seq_obj
+    def _get_frange(self) -> str:
+        """ Get the fileseq frame range string of the Sequence, computed once.
+        """
+        if self._frange is None:
+            self._frange = fileseq.FrameSet.framesToFrameRange(
+                self._frame_range or (), sort=False, compress=False
+            )
+
+        return self._frange
 
     def __iter__(self) -> list:
         """ Iterate over the path(s) of the Sequence.
         """
-        if not self.has_frame_range:
-            return
-
-        for path in self._data:
-            yield os.path.abspath(path)
+        return self.iter_paths()
 
     def __len__(self) -> int:
         """ The amount of path(s) in the sequence.
         """
-        return len(self._data)
+        if not self._has_frame_range or not self._zfill:
+            return 1  # a single path, like fileseq
+
+        return len(self._frame_range)
 
     def __eq__(self, other: object) -> bool:
-        """ Is equal ?
+        """ Is equal ? (same frame paths)
         """
+        if isinstance(other, Sequence):
+            return self is other or (hash(self) == hash(other) and self._get_key() == other._get_key())
+
         return tuple(self) == tuple(other)
 
     def __ne__(self, other: object)  -> bool:
         """ Is not equal ?
         """
-        return repr(self) != repr(other)
+        return not self == other
 
     def __hash__(self) -> int:
         """ Hash representation of the sequence.
         """
-        return hash(tuple(self))
+        if self._hash is None:
+            self._hash = hash(self._get_key())
+
+        return self._hash
+
+    def _get_key(self) -> tuple:
+        """ The canonical key of the Sequence, equal for sequences with the same frame paths:
+        (absolute directory, head, padding, tail, frame range).
+        """
+        if self._key is None:
+            frame_range = self.frame_range if self.has_frame_range else None
+
+            # Zero padding has no effect on the paths when every frame is at least as long.
+            zfill = self._zfill
+            if frame_range is not None and zfill <= _get_shortest_frame_length(frame_range):
+                zfill = 0
+
+            self._key = (os.path.abspath(self._dirname), self.head, zfill, self.tail, frame_range)
+
+        return self._key
 
     def __repr__(self) -> str:
         """ The representation of the Sequence.
         """
-        return f"<{self.__class__.__name__} {self._data}>"
+        frange = self._get_frange()
+        padding = self._padding_chars if frange else ""
+        return f"<{self.__class__.__name__} {self._dirname}{self._head}{frange}{padding}{self._tail}>"
 
     def __str__(self) -> str:
         """ The string representation of the Sequence.
@@ -96,39 +318,41 @@ class Sequence:
         if not self.has_frame_range:
             raise NoFrameRangeError("No frame range information available.")
 
-        return os.path.abspath(self._data.frame(self._data.end()))
+        return self._get_path_template() % self._frame_range.end
 
     @property
     def head(self) -> str:
         """ The Sequence head string (before the frame range).
         """
-        return self._data.basename()
+        return self._head
 
     @property
     def missing(self) -> list:
         """ A list of the missing frames.
         """
-        return [
-            self._data.frame(frame) for frame in fileseq.FrameSet(self._data.frameSet().invertedFrameRange())
-        ]
+        if self._missing is None:
+            missing = self._frame_range.missing if self.has_frame_range else []
+            self._missing = tuple(map(self._get_path_template(absolute=False).__mod__, missing))
+
+        return list(self._missing)
 
     @property
     def padding(self) -> int:
         """ The maximum padding of the Sequence.
         """
-        return max((self._data.zfill(), len(str(max(self._data.frameSet()))) if self.has_frame_range else 1,))
+        return self._padding
 
     @property
     def has_frame_range(self) -> bool:
         """ Does the sequence have frame range information?
         """
-        return bool(self._data.frameSet())
+        return self._has_frame_range
 
     @property
     def has_leading_zeros(self) -> bool:
         """ Is the sequence numbered with leading zeroes ?
         """
-        return self._data.zfill() > 1
+        return self._zfill > 1
 
     @property
     def start(self) -> str:
@@ -139,13 +363,13 @@ class Sequence:
         if not self.has_frame_range:
             raise NoFrameRangeError("No frame range information available.")
 
-        return os.path.abspath(self._data.frame(self._data.start()))
+        return self._get_path_template() % self._frame_range.start
 
     @property
     def tail(self) -> str:
         """ The Sequence tail string (after the frame range).
         """
-        return self._data.extension()
+        return self._tail
 
     @property
     def frame_range(self) -> _frame_range.FrameRange:
@@ -156,12 +380,7 @@ class Sequence:
         if not self.has_frame_range:
             raise NoFrameRangeError("No frame range information available.")
 
-        return _frame_range.FrameRange(
-            self._data.start(),
-            self._data.end(),
-            padding=self.padding,
-            missing=list(fileseq.FrameSet(self._data.frameSet().invertedFrameRange())),
-        )
+        return self._frame_range
 
     def format(self, format_str: Union[str, _formats.PredefinedFormat]) -> str:
         """ Format the Sequence based on a format string.
@@ -169,7 +388,13 @@ class Sequence:
         if self._single_frame:
             return self.start  # no need to format, there is only one path
 
-        return _formats.format_sequence(self, format_str)
+        try:
+            return self._formatted[format_str]
+        except KeyError:
+            pass
+
+        self._formatted[format_str] = _formats.format_sequence(self, format_str)
+        return self._formatted[format_str]
 
     def get_frame_path(self, frame_number: int) -> str:
         """ Get the frame path from a provided frame number.
@@ -179,23 +404,145 @@ class Sequence:
         :rtype: str
         :raises ValueError: If the frame number is not part of the sequence.
         """
-        if frame_number not in self._data.frameSet():
+        if not self.has_frame_range or frame_number not in self._frame_range:
             raise ValueError(f"Invalid frame number: {frame_number}.")
 
-        return self._data.frame(frame_number)
+        return self._get_path_template(absolute=False) % frame_number
+
+    def frame_paths(self, frames: collections.abc.Iterable) -> list:
+        """ Get the absolute paths of some frames from the Sequence.
+
+        :raises ValueError: If a frame number is not part of the sequence.
+        """
+        frames = list(frames)
+        invalid_frames = {
+            frame for frame in frames if not self.has_frame_range or frame not in self._frame_range
+        }
+        if invalid_frames:
+            raise ValueError(f"Invalid frame numbers: {sorted(invalid_frames, key=str)}.")
+
+        return list(map(self._get_path_template().__mod__, frames))
+
+    def iter_paths(self) -> collections.abc.Iterator:
+        """ Iterate over the absolute path(s) of the Sequence frames.
+        """
+        if not self.has_frame_range:
+            return iter(())
+
+        return map(self._get_path_template().__mod__, self._frame_range)
+
+    def _get_path_template(self, absolute: bool = True) -> str:
+        """ Get the %-format path template of the Sequence frames, computed once.
+        The directory (made absolute if requested) and the head are resolved, the padding is fixed.
+        """
+        try:
+            return self._path_templates[absolute]
+        except KeyError:
+            pass
+
+        dirname = self._dirname
+        if absolute:
+            dirname = os.path.join(os.path.abspath(dirname), "")
+
+        self._path_templates[absolute] = "%s%%0%dd%s" % (
+            (dirname + self._head).replace("%", "%%"),
+            self._zfill,
+            self._tail.replace("%", "%%"),
+        )
+        return self._path_templates[absolute]
+
+    def frames_array(self) -> "numpy.ndarray":
+        """ Get the Sequence frames as a numpy int64 array, computed from the frame range runs.
+
+        :raises NoFrameRangeError: If there's no frame range available
+        :raise RuntimeError: When numpy is not available.
+        """
+        return self.frame_range.to_numpy()
+
+    def scan(self) -> ScanResult:
+        """ Gather the existence and stats of the Sequence frames from a single directory listing.
+        Fall back to per-frame stats when the directory is much larger than the sequence.
+
+        :raises NoFrameRangeError: If there's no frame range available
+        """
+        if not self.has_frame_range:
+            raise NoFrameRangeError("No frame range information available.")
+
+        frames = self._frame_range
+        head, tail = self._head, self._tail
+        path_template = self._get_path_template(absolute=False)
+        max_entries = max(_SCAN_MIN_ENTRIES, _SCAN_MAX_RATIO * len(frames))
+        stats = {}
+        listed = True
+
+        try:
+            with os.scandir(self._dirname or os.curdir) as entries:
+                for index, entry in enumerate(entries):
+                    if index >= max_entries:
+                        listed = False
+                        break
+
+                    name = entry.name
+                    if not name.startswith(head) or not name.endswith(tail):
+                        continue
+
+                    try:
+                        frame = int(name[len(head):len(name) - len(tail)])
+                    except ValueError:
+                        continue
+
+                    if (
+                        frame in frames
+                        and os.path.basename(path_template % frame) == name
+                        and entry.is_file()
+                    ):
+                        stats[frame] = entry.stat()
+
+        except FileNotFoundError:
+            pass  # all frames are missing
+
+        except OSError:
+            # Unreadable directory (ex: permission denied, not a directory), stat frames individually:
+            # they are missing unless they can be reached without listing the directory.
+            stats.clear()
+            listed = False
+
+        if listed:
+            return ScanResult(stats, [frame for frame in frames if frame not in stats])
+
+        # Directory too large, stat remaining frames individually.
+        missing = []
+        for frame in frames:
+            if frame in stats:
+                continue
+
+            try:
+                stats[frame] = os.stat(path_template % frame)
+            except OSError:
+                missing.append(frame)
+
+        return ScanResult(stats, missing)
 
     @classmethod
     def from_string(cls, str_data: str, allow_empty: bool = False):
         """ Initialize a Sequence object from a string.
 
+        Paths which cannot have frames (ex: "/path/to/clip.mov") are rejected without being parsed,
+        and the most recently parsed strings are not parsed again.
+
         :raise ValueError: When the provided string could not be uncompressed as a Sequence object.
         """
-        file_seq_sequence = fileseq.FileSequence(_utils.conform_path(str_data))
+        if not allow_empty and not _utils.has_sequence_hint(str_data):
+            raise ValueError(f"Invalid path: {str_data}.")
 
-        if not allow_empty and not file_seq_sequence.frameSet():
+        components = _parse_sequence_string(str_data)
+
+        if not allow_empty and components[4] is None:  # no frame range
             raise ValueError(f"Path have no frame range information: {str_data}.")
 
-        return cls(file_seq_sequence)
+        sequence = cls.__new__(cls)
+        sequence._initialize(*components)  # pylint: disable=protected-access
+        return sequence
 
     @classmethod
     def from_list(cls, list_data: list, single_entry: bool = True):
@@ -203,27 +550,30 @@ class Sequence:
 
         :raises ValueError: If no sequence could be resolved.
         """
-        file_seq_objs = _utils.find_sequences_in_list(list_data)[0]
+        discovered = _utils.discover_sequences_in_list(list_data)[0]
 
-        if file_seq_objs:
+        if discovered:
             if single_entry:
-                return cls(file_seq_objs[0])
+                return cls(discovered[0])
 
-            return [cls(file_seq_obj) for file_seq_obj in file_seq_objs]
+            return [cls(discovered_sequence) for discovered_sequence in discovered]
 
         raise ValueError(f"Could not find any sequence in {list_data}.")
 
     @classmethod
-    def iter_sequences(cls, data: Union[str, list]) -> list:
+    def iter_sequences(cls, data: Union[str, list], ordered: bool = True) -> list:
         """ Iterate over the Sequence objects(s) from a provided data.
             (path on disk or random list)
+
+        When listing a path on disk with `ordered=False`, sequences are yielded as soon as they are
+        discovered instead of sorted.
         """
         if isinstance(data, str):
-            for file_seq_sequence in _utils.find_sequences_on_disk(data):
+            for file_seq_sequence in _utils.find_sequences_on_disk(data, ordered=ordered):
                 yield cls(file_seq_sequence)
         else:
-            for file_seq_sequence in _utils.find_sequences_in_list(data)[0]:
-                yield cls(file_seq_sequence)
+            for discovered_sequence in _utils.discover_sequences_in_list(data)[0]:
+                yield cls(discovered_sequence)
 
     @classmethod
     def get_sequences(cls, data: Union[str, list]) -> list:
@@ -1,9 +1,25 @@
 """ Helper methods for fileseq path conforming.
 """
+from typing import Union
+
+import bisect
+import collections.abc
+import os
 import re
 
 import fileseq
 
+BACKEND_NATIVE = "native"
+BACKEND_FILESEQ = "fileseq"
+BACKENDS = (BACKEND_NATIVE, BACKEND_FILESEQ)
+
+# Regex used by fileseq to split a path into (dirname, head, frame, tail).
+_DISK_RE = fileseq.constants.DISK_RE
+_DIGITS_RE = re.compile(r"\d+")
+
+# ASCII digits are all alike for `_DISK_RE`: paths with the same digit-less shape are split the same way.
+_ZERO_DIGITS = bytes.maketrans(b"123456789", b"000000000")
+
 # Regex for the padding notation
 # Will match: '#', '###', '@', '@@', '%d', '%03d', '$F', '$F4', etc
 REGEX_PADDING = r"#+|@+|%(?:\d+)?d|\$F(?:\d+)?"
@@ -25,6 +41,17 @@ REGEX_SEQUENCE_PATH = (
     )
 )
 
+# A sequence path has a padding token, a frame number before its extension(s) or a trailing frame range.
+# Paths without any of them (ex: "/path/to/clip.mov") can be rejected without the regex above.
+_SEQUENCE_HINT_RE = re.compile(r"[#@%$]|\d\)?(?:\.\w+)+$|[\d\])]$")
+
+
+def has_sequence_hint(path: str) -> bool:
+    """ Can the path be a sequence path with frames ?
+    False only for paths which cannot, like paths without any digit nor padding token.
+    """
+    return _SEQUENCE_HINT_RE.search(path) is not None
+
 
 def conform_path(path: str) -> tuple:
     """ Conform a path to it can be processed by `fileseq`.
@@ -113,6 +140,54 @@ def _conform_padding(value: str) -> str:
     return value
 
 
+class DiscoveredSequence:  # pylint: disable=too-few-public-methods
+    """ The components of a sequence found by the native detection, a Sequence can be
+    initialized from them without building any fileseq object.
+    """
+
+    __slots__ = ("dirname", "head", "zfill", "tail", "frames", "frange")
+
+    def __init__(
+        self, dirname: str, head: str, zfill: int, tail: str, frames: list, frange: str
+    ):  # pylint: disable=too-many-arguments
+        """ Initialize a DiscoveredSequence from its components, its sorted and unique frames,
+        and its fileseq frame range string.
+        """
+        self.dirname = dirname
+        self.head = head
+        self.zfill = zfill
+        self.tail = tail
+        self.frames = frames
+        self.frange = frange
+
+    def __repr__(self) -> str:
+        """ The representation of the DiscoveredSequence, same as the equivalent fileseq sequence.
+        """
+        return "<FileSequence: '%s%s%s%s%s'>" % (
+            self.dirname, self.head, self.frange, fileseq.FileSequence.getPaddingChars(self.zfill), self.tail
+        )
+
+
+def build_fileSeq_sequence(
+    dirname: str, head: str, padding: str, tail: str, frame_set: fileseq.FrameSet
+) -> fileseq.FileSequence:  # pylint: disable=too-many-arguments
+    """ Build a fileseq sequence from its components and padding characters.
+
+    Same as `fileseq.FileSequence.yield_sequences_in_list`: the sequence is built behind the scenes
+    since its string representation cannot always be parsed back.
+    """
+    # pylint: disable=protected-access
+    fileSeq_sequence = fileseq.FileSequence.__new__(fileseq.FileSequence)
+    fileSeq_sequence._dir = dirname
+    fileSeq_sequence._base = head
+    fileSeq_sequence._ext = tail
+    fileSeq_sequence._frameSet = frame_set
+    fileSeq_sequence._pad = padding
+    fileSeq_sequence.__init__(str(fileSeq_sequence))
+
+    return fileSeq_sequence
+
+
 def _conform_discovered_fileSeq(sequence: fileseq.FileSequence) -> fileseq.FileSequence:
     """ Conform a raw fileSeq sequences obtained from discovery methods like:
 
@@ -139,10 +214,34 @@ def validate_file_sequence(file_seq_obj: fileseq.FileSequence):
         raise ValueError("Sequence has got no frame information.")
 
 
-def find_sequences_on_disk(data: str) -> list:
-    """ Wrapper around `fileseq.findSequencesOnDisk`.
+def find_sequences_on_disk(data: str, ordered: bool = True) -> list:
+    """ Find the sequences in a directory, or matching a `fileseq.findSequencesOnDisk` pattern.
+
+    Directories are streamed with `os.scandir` and their files grouped as they are listed,
+    their sequences are yielded as `DiscoveredSequence` objects, without building any fileseq object.
+    Sequences are sorted by default, with `ordered=False` they are yielded as soon as they are built.
     """
-    for fileSeq_sequence in sorted(fileseq.findSequencesOnDisk(data), key=repr):
+    if os.path.isdir(data):
+        groups = _group_frames(_iter_directory_files(data))
+        discovered = (
+            _discover_sequence(prefix, tail, dirname_end, frames)
+            for (prefix, tail), (dirname_end, frames) in groups.items()
+        )
+        if ordered:
+            discovered = sorted(discovered, key=repr)
+
+        for discovered_sequence in discovered:
+            yield _conform_discovered_sequence(discovered_sequence)
+
+        return
+
+    # Patterns (ex: "/path/to/img_{left,right}.#.exr") are resolved by fileseq.
+    fileSeq_sequences = fileseq.findSequencesOnDisk(data)
+
+    if ordered:
+        fileSeq_sequences = sorted(fileSeq_sequences, key=repr)
+
+    for fileSeq_sequence in fileSeq_sequences:
         try:
             validate_file_sequence(fileSeq_sequence)
         except ValueError:
@@ -151,8 +250,33 @@ def find_sequences_on_disk(data: str) -> list:
         yield _conform_discovered_fileSeq(fileSeq_sequence)
 
 
-def find_sequences_in_list(list_data: list) -> tuple:
-    """ Wrapper around `fileseq.findSequencesInList`.
+def _iter_directory_files(dirpath: str) -> collections.abc.Iterator:
+    """ Iterate over the paths of the non-hidden files of a directory, like `fileseq.findSequencesOnDisk`.
+    """
+    if not dirpath.endswith(os.sep):
+        dirpath += os.sep
+
+    try:
+        with os.scandir(dirpath) as entries:
+            for entry in entries:
+                if entry.name.startswith("."):
+                    continue
+
+                # Use the type from the directory listing, no need to stat each entry.
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+
+                if not is_dir:
+                    yield dirpath + entry.name
+
+    except OSError:
+        return  # unreadable directory, like os.walk
+
+
+def find_sequences_in_list(list_data: list, backend: str = BACKEND_NATIVE) -> tuple:
+    """ Find the sequences in a list of paths, return them along the paths that are not part of any sequence.
 
     There are two ways of creating sequences from a list:
     - lite_media_core.path_utils.get_sequences
@@ -160,17 +284,43 @@ def find_sequences_in_list(list_data: list) -> tuple:
 
     Both will refer this common logic, however they don't act the same when encountering a list containing
     non-sequence (`getSequences` yield a :class:`SingleFile`, `Sequence.fromList` will ignore it).
+
+    Two detection backends give the same results:
+    - BACKEND_NATIVE (default): single pass over the list, cheap for very large lists.
+    - BACKEND_FILESEQ: wrapper around `fileseq.findSequencesInList`.
+
+    :raises ValueError: If the backend is unknown.
+    """
+    if backend == BACKEND_NATIVE:
+        discovered, remains = discover_sequences_in_list(list_data)
+        return [_build_discovered_fileSeq(discovered_sequence) for discovered_sequence in discovered], remains
+
+    if backend == BACKEND_FILESEQ:
+        return _find_sequences_in_list_fileseq(list_data)
+
+    raise ValueError(f"Unknown sequence detection backend: {backend!r}, expected one of {BACKENDS}.")
+
+
+def _is_ambiguous(basename: str) -> bool:
+    """ Is the discovered sequence an incorrectly recognized "contained" notation ?
+
+    Hack: fileseq can incorrectly recognize a "contained" notation without a padding identifier.
+    >>> fileseq.findSequencesInList(['0001-0010.ext'])
+    [<FileSequence: '0001-10@@@@@.ext'>]
+    A common symptom is that the head of the sequence end with
+    a number which is weird by itself.
+    """
+    return next(reversed(basename), "").isdigit()
+
+
+def _find_sequences_in_list_fileseq(list_data: list) -> tuple:
+    """ Wrapper around `fileseq.findSequencesInList`.
     """
     sequences = []
     remains = set(list_data)
 
     for fileSeq_sequence in sorted(fileseq.findSequencesInList(list_data), key=repr):
-        # Hack: fileseq can incorrectly recognize a "contained" notation without a padding identifier.
-        # >>> fileseq.findSequencesInList(['0001-0010.ext'])
-        # [<FileSequence: '0001-10@@@@@.ext'>]
-        # A common symptom is that the head of the sequence end with
-        # a number which is weird by itself.
-        if next(reversed(fileSeq_sequence.basename()), "").isdigit():
+        if _is_ambiguous(fileSeq_sequence.basename()):
             continue
 
         try:
@@ -186,3 +336,247 @@ def find_sequences_in_list(list_data: list) -> tuple:
 
     # Start by yielding sequence from string representation
     return sequences, remains
+
+
+def _build_discovered_fileSeq(discovered_sequence: DiscoveredSequence) -> fileseq.FileSequence:
+    """ Build the fileseq sequence of a discovered sequence, its frame set is built behind the scenes
+    since its frame range string is already known.
+    """
+    # pylint: disable=protected-access
+    frame_set = fileseq.FrameSet.__new__(fileseq.FrameSet)
+    frame_set._frange = discovered_sequence.frange
+    frame_set._order = tuple(discovered_sequence.frames)
+    frame_set._items = frozenset(frame_set._order)
+
+    return build_fileSeq_sequence(
+        discovered_sequence.dirname,
+        discovered_sequence.head,
+        fileseq.FileSequence.getPaddingChars(discovered_sequence.zfill),
+        discovered_sequence.tail,
+        frame_set,
+    )
+
+
+def _discover_sequence(prefix: str, tail: str, dirname_end: int, frames: list) -> DiscoveredSequence:
+    """ Resolve a group of frame strings into a sequence, like fileseq does for discovered sequences:
+    the padding is resolved from the shortest frame string and the directory ends with a separator.
+    """
+    dirname = prefix[:dirname_end]
+    if dirname and not dirname.endswith(os.sep):
+        dirname += os.sep
+
+    numbers = sorted(set(map(int, frames)))
+    return DiscoveredSequence(
+        dirname,
+        prefix[dirname_end:],
+        min(map(len, frames)),
+        tail,
+        numbers,
+        fileseq.FrameSet.framesToFrameRange(numbers, sort=False, compress=False),
+    )
+
+
+def _conform_discovered_sequence(discovered_sequence: DiscoveredSequence) -> DiscoveredSequence:
+    """ Same as `_conform_discovered_fileSeq` for a sequence found by the native detection.
+    """
+    if discovered_sequence.zfill == len(str(discovered_sequence.frames[0])):
+        discovered_sequence.zfill = 1
+
+    return discovered_sequence
+
+
+def _is_sequence_path(path: str, sequences_by_affixes: dict) -> bool:
+    """ Is the provided path one of the paths of the provided sequences ?
+    """
+    for digits in _DIGITS_RE.finditer(path):
+        start, end = digits.span()
+
+        # The frame can be negative.
+        for frame_start in (start - 1, start) if path[start - 1 : start] == "-" else (start,):
+            discovered_sequence = sequences_by_affixes.get((path[:frame_start], path[end:]))
+            if discovered_sequence is None:
+                continue
+
+            frame = path[frame_start:end]
+            frames = discovered_sequence.frames
+            index = bisect.bisect_left(frames, int(frame))
+            if (
+                index < len(frames)
+                and frames[index] == int(frame)
+                and str(int(frame)).zfill(discovered_sequence.zfill) == frame
+            ):
+                return True
+
+    return False
+
+
+def _is_padded(frame: str, zfill: int) -> bool:
+    """ Is the frame string formatted with the provided padding ?
+    """
+    # Positive frames without leading zero or at the padding length are, don't bother parsing them.
+    if frame[0] != "-" and (frame[0] != "0" or len(frame) == zfill):
+        return True
+
+    return str(int(frame)).zfill(zfill) == frame
+
+
+def _get_frame_span(path: str) -> tuple:
+    """ Get the (dirname end, frame start, frame end) positions of a path split by `_DISK_RE`.
+    The tuple is empty if fileseq would not consider the path as a sequence frame.
+    """
+    match = _DISK_RE.match(path)
+    if match is None or match.group(3) is None or not (match.group(2) or match.group(4)):
+        return ()
+
+    return match.end(1), match.start(3), match.end(3)
+
+
+def _group_frames(paths: collections.abc.Iterable, ungrouped: set = None) -> dict:
+    """ Group paths by (dirname + head, tail) into frame strings, in a single pass.
+
+    The split positions are only resolved once per path shape (ex: "/shot010/img.1001.exr" and
+    "/shot020/img.1002.exr"). Paths that fileseq would not consider as sequence frames are added to `ungrouped`.
+
+    :return: {(dirname + head, tail): (dirname length, [frame string, ...])}
+    """
+    shapes = {}
+    groups = {}
+
+    for path in paths:
+        shape = path.encode("utf-8", "surrogatepass").translate(_ZERO_DIGITS)
+        spans = shapes.get(shape)
+        if spans is None:
+            spans = shapes[shape] = _get_frame_span(path)
+
+        if not spans:
+            if ungrouped is not None:
+                ungrouped.add(path)
+            continue
+
+        dirname_end, frame_start, frame_end = spans
+        affixes = (path[:frame_start], path[frame_end:])
+        group = groups.get(affixes)
+        if group is None:
+            group = groups[affixes] = (dirname_end, [])
+
+        group[1].append(path[frame_start:frame_end])
+
+    return groups
+
+
+def discover_sequences_in_list(list_data: list) -> tuple:
+    """ Same as `_find_sequences_in_list_fileseq` in a single pass over the list.
+
+    The padding of a group is resolved from its shortest frame string, like fileseq does,
+    and sequences are returned as `DiscoveredSequence` objects, without building any fileseq object.
+    """
+    remains = set()
+    groups = _group_frames(list_data, remains)
+
+    discovered = []
+    for (prefix, tail), (dirname_end, frames) in groups.items():
+        discovered_sequence = _discover_sequence(prefix, tail, dirname_end, frames)
+
+        if _is_ambiguous(discovered_sequence.head):
+            remains.update(prefix + frame + tail for frame in frames)
+            continue
+
+        discovered.append((discovered_sequence, (prefix, tail), frames))
+
+    sequences = []
+    # (dirname + head, tail) -> sequence, to find back the sequence a path could belong to.
+    sequences_by_affixes = {}
+
+    for discovered_sequence, (prefix, tail), frames in sorted(discovered, key=lambda item: repr(item[0])):
+        sequences.append(_conform_discovered_sequence(discovered_sequence))
+
+        affixes = (discovered_sequence.dirname + discovered_sequence.head, discovered_sequence.tail)
+        sequences_by_affixes[affixes] = discovered_sequence
+
+        if affixes == (prefix, tail):
+            # Only the frames formatted with the sequence padding belong to the sequence.
+            zfill = discovered_sequence.zfill
+            remains.update(prefix + frame + tail for frame in frames if not _is_padded(frame, zfill))
+        else:
+            remains.update(prefix + frame + tail for frame in frames)
+
+    # Like fileseq, a path can belong to a sequence even if it was not grouped with it.
+    # ex: "img.exr8.exr" has no frame for fileseq but is part of "img.exr-1,8@.exr".
+    if sequences_by_affixes:
+        remains = {path for path in remains if not _is_sequence_path(path, sequences_by_affixes)}
+
+    return sequences, remains
+
+
+def _get_chunk_prefix(path: str) -> Union[str, None]:
+    """ Get the part of a path before the first number of its basename, None if the basename has no number.
+    """
+    basename_start = max(path.rfind("/"), path.rfind("\\")) + 1
+    match = _DIGITS_RE.search(path, basename_start)
+    if match is None:
+        return None
+
+    start = match.start()
+    if start > basename_start and path[start - 1] == "-":
+        start -= 1
+
+    return path[:start]
+
+
+def _continues_chunk(path: str, prefix: str) -> bool:
+    """ Is the chunk prefix of a path starting with the provided chunk prefix the same ?
+    Faster than `_get_chunk_prefix` for consecutive paths of a chunk.
+    """
+    rest = path[len(prefix) :]
+    if "/" in rest or "\\" in rest:
+        return False
+
+    if rest[:1] == "-":
+        return rest[1:2].isdecimal()
+
+    return rest[:1].isdecimal() and not prefix.endswith("-")
+
+
+def iter_sequences_in_sorted_list(sorted_data: collections.abc.Iterable) -> collections.abc.Iterator:
+    """ Same as `discover_sequences_in_list` for an iterable of paths sorted by code point, consumed as a stream.
+
+    Paths are gathered in chunks sharing the part before the first number of their basename (ex: "/path/img.").
+    A sequence, and any path fileseq would attach to it, belong to the same chunk. Since a sorted input
+    never comes back to a chunk once it moved past it, chunks are resolved one after the other and only
+    the chunks still open are held in memory.
+
+    :return: The (discovered sequences, remains) of each chunk.
+    :raises ValueError: If the paths are not sorted by code point.
+    """
+    # Open chunks as [(prefix, paths), ...], each prefix is a prefix of the next one.
+    chunks = []
+    previous = None
+
+    for path in sorted_data:
+        if previous is not None and path <= previous:
+            if path == previous:
+                continue
+
+            raise ValueError(f"Paths are not sorted: {path!r} comes after {previous!r}.")
+
+        previous = path
+
+        while chunks and not path.startswith(chunks[-1][0]):
+            yield discover_sequences_in_list(chunks.pop()[1])
+
+        if chunks and _continues_chunk(path, chunks[-1][0]):
+            chunks[-1][1].append(path)
+            continue
+
+        prefix = _get_chunk_prefix(path)
+        if prefix is None:
+            yield [], {path}  # without number, the path cannot be part of a sequence
+
+        elif chunks and chunks[-1][0] == prefix:
+            chunks[-1][1].append(path)
+
+        else:
+            chunks.append((prefix, [path]))
+
+    while chunks:
+        yield discover_sequences_in_list(chunks.pop()[1])
@@ -31,3 +31,75 @@ class TestGetSequences(unittest.TestCase):
             ["img.%d.exr 1-10"],
         ):
             self.assertFalse(next(lite_media_core.path_utils.get_sequences(data)).has_leading_zeros, msg=data)
+
+
+class TestGetSequencesSorted(unittest.TestCase):
+    """ Test out lite_media_core.path_utils.get_sequences_sorted feature.
+    """
+
+    def test_same_as_get_sequences(self):
+        """ Ensure the same sequences and single files are found as with get_sequences.
+        """
+        data = [
+            "/path/a.txt",
+            "/path/img-1.exr",
+            "/path/img.0001.exr",
+            "/path/img.001.exr",
+            "/path/img.002.exr",
+            "/path/img.002.tar.gz",
+            "/path/img.1.exr",
+            "/path/img.exr",
+            "/path/img.exr8.exr",
+            "/path/img.exr008.exr",
+            "/path/img/sub.1.exr",
+            "/path/img/sub.2.exr",
+            "/path/img1.exr",
+            "/path/notes_v2.txt",
+        ]
+
+        self.assertEqual(
+            sorted(str(item) for item in lite_media_core.path_utils.get_sequences(data)),
+            sorted(str(item) for item in lite_media_core.path_utils.get_sequences_sorted(sorted(data))),
+        )
+
+    def test_stream(self):
+        """ Ensure a sequence is yielded as soon as the input moved past it.
+        """
+        def iter_data():
+            yield "/path/a.1.exr"
+            yield "/path/a.2.exr"
+            yield "/path/b.1.exr"
+            raise RuntimeError("Input should not be consumed further.")
+
+        self.assertEqual(
+            "<Sequence '/path/a.#.exr 1-2'>", str(next(lite_media_core.path_utils.get_sequences_sorted(iter_data())))
+        )
+
+    def test_duplicates(self):
+        """ Ensure duplicated paths are ignored.
+        """
+        self.assertEqual(
+            ["<Sequence '/path/img.#.exr 1-2'>", "a.txt"],
+            [
+                str(item) for item in lite_media_core.path_utils.get_sequences_sorted(
+                    ["/path/img.1.exr", "/path/img.1.exr", "/path/img.2.exr", "a.txt", "a.txt"]
+                )
+            ],
+        )
+
+    def test_unsorted(self):
+        """ Ensure a ValueError is raised when the paths are not sorted.
+        """
+        with self.assertRaises(ValueError):
+            list(lite_media_core.path_utils.get_sequences_sorted(["/path/img.2.exr", "/path/img.1.exr"]))
+
+    def test_locale_collated(self):
+        """ Ensure paths must be sorted by code point, not collated like `sort` under most locales.
+        """
+        self.assertEqual(
+            ["/path/B.txt", "/path/a.txt"],
+            [str(item) for item in lite_media_core.path_utils.get_sequences_sorted(["/path/B.txt", "/path/a.txt"])],
+        )
+
+        with self.assertRaises(ValueError):
+            list(lite_media_core.path_utils.get_sequences_sorted(["/path/a.txt", "/path/B.txt"]))
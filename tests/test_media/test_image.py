@@ -1,13 +1,19 @@
 """ Test lite_media_core.media._image module.
 """
 # pylint: disable=too-many-public-methods
+import concurrent.futures
 import os
 import shutil
+import struct
 import tempfile
 import unittest
+import zlib
+
+from unittest import mock
 
 from lite_media_core import media
 from lite_media_core import path_utils
+from lite_media_core import resolution
 from lite_media_core.media import _image
 
 media_path = _mediaPath = os.path.join(
@@ -174,6 +180,69 @@ class TestImageSequence(unittest.TestCase):
             (seqMedia.frame_range, len(seqMedia)),
         )
 
+    def test_getitem_slice(self):
+        """ Ensure a slice of an ImageSequence is a sub-sequence.
+        """
+        seqMedia = media.ImageSequence("img.%04d.png 1-10 ([3, 5])")
+        subSequence = seqMedia[1:4]
+
+        self.assertEqual(
+            (True, [2, 4, 6], [3, 5]),
+            (
+                isinstance(subSequence, media.ImageSequence),
+                list(subSequence.frame_range),
+                subSequence.frame_range.missing,
+            ),
+        )
+
+    def test_getitem_sliceStep(self):
+        """ Ensure a stepped slice of an ImageSequence is a sub-sequence.
+        """
+        seqMedia = media.ImageSequence("img.1001-1010#.png")
+        self.assertEqual([1001, 1004, 1007, 1010], list(seqMedia[::3].frame_range))
+
+    def test_getitem_sliceEmpty(self):
+        """ Ensure an empty slice of an ImageSequence raises.
+        """
+        with self.assertRaises(IndexError):
+            _ = self.img_sequence[2:1]
+
+    def test_getitem_outOfRange(self):
+        """ Ensure an out of range index raises.
+        """
+        with self.assertRaises(IndexError):
+            _ = self.img_sequence[3]
+
+    def test_missing_image_lazy(self):
+        """ Ensure missing images are built on demand and behave like a list.
+        """
+        imageSequence = media.ImageSequence("sequence.%04d.exr 1-10 ([2,4,6,8])")
+        missing = imageSequence.missing
+
+        self.assertEqual(
+            (4, "sequence.0004.exr", ["sequence.0006.exr", "sequence.0008.exr"]),
+            (len(missing), missing[1].path, [image.path for image in missing[2:]]),
+        )
+
+    def test_len_large(self):
+        """ Ensure a large ImageSequence does not build all its images upfront.
+        """
+        seqMedia = media.ImageSequence("img.%07d.exr 1-1000000")
+
+        self.assertEqual(
+            (1000000, os.path.join(os.getcwd(), "img.0500000.exr")),
+            (len(seqMedia), seqMedia[499999].path),
+        )
+
+    def test_frameRange_cached(self):
+        """ Ensure the frame range of a sparse ImageSequence is built once, not on each access.
+        """
+        frames = ["img.%07d.exr" % frame for frame in range(1, 200001, 2)]
+        seqMedia = media.ImageSequence(path_utils.Sequence.from_list(frames))
+
+        self.assertIs(seqMedia.frame_range, seqMedia.frame_range)
+        self.assertEqual((100000, 99999), (len(seqMedia.frame_range), len(seqMedia.frame_range.missing)))
+
     def test_imageSequence_fromImages(self):
         """ Ensure an image sequence can be created from image paths.
         """
@@ -259,51 +328,376 @@ class TestImageSequence(unittest.TestCase):
 class TestImageSequenceUtils(unittest.TestCase):
     """ Test lite_media_core.media._image utilities.
     """
+    def setUp(self):
+        """ Set up testing class.
+        """
+        super(TestImageSequenceUtils, self).setUp()
+        self.tempdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """ Tear down the testing class.
+        """
+        super(TestImageSequenceUtils, self).tearDown()
+        shutil.rmtree(self.tempdir)
+
     def test_validateSequence(self):
         """ Test with a valid media sequence.
         """
-        image_media = [
-            media.Image("/path/to/an/image1.png"),
-            media.Image("/path/to/an/image2.png"),
-        ]
-
-        self.assertTrue(_image._validate_sequence(image_media))  # pylint: disable=W0212
+        img_sequence = media.ImageSequence("/path/to/an/image.1-2#.png")
+        self.assertTrue(img_sequence.validate())
 
     def test_validate_sequence_invalidEmpty(self):
         """ Test invalid sequence (empty).
         """
+        report = _image.ValidationReport()
+
         with self.assertRaises(ValueError):
-            _ = _image._validate_sequence([])  # pylint: disable=W0212
+            report._raise()  # pylint: disable=W0212
+
+        self.assertFalse(report)
 
     def test_validate_sequence_invalidMixTypes(self):
         """ Test invalid sequence (mix of mime types).
         """
-        image_media = [
-            media.Image(os.path.join(media_path, "img.dpx")),
-            media.Image(os.path.join(media_path, "img.png")),
-        ]
+        report = _image.ValidationReport()
+        report.count = 2
+        report.sub_types = {"x-dpx", "png"}
 
-        with self.assertRaises(ValueError):
-            _ = _image._validate_sequence(image_media)  # pylint: disable=W0212
+        with self.assertRaises(media.UnsupportedMimeType) as context:
+            report._raise()  # pylint: disable=W0212
+
+        self.assertIs(report, context.exception.report)
+
+        self.assertFalse(report)
 
     def test_validate_sequence_invalidMissingFrame(self):
         """ Test invalid sequence (mix or existing and missing).
         """
-        image_media = [
-            media.Image(os.path.join(media_path, "img.dpx")),
-            media.Image("/path/to/a/missing/image.dpx"),
-        ]
+        shutil.copy(os.path.join(media_path, "img.dpx"), os.path.join(self.tempdir, "img.1001.dpx"))
+        img_sequence = media.ImageSequence(os.path.join(self.tempdir, "img.1001-1002#.dpx"))
+
+        self.assertEqual(([1001], [1002]), (img_sequence.scan().present, img_sequence.scan().missing))
 
         with self.assertRaises(ValueError):
-            _ = _image._validate_sequence(image_media)  # pylint: disable=W0212
+            _ = img_sequence.validate()
 
     def test_validate_sequence_invalidInconsistentResolution(self):
         """ Test invalid sequence (inconsistent resolution).
         """
-        image_medias = [
-            media.Movie(os.path.join(media_path, "video.mov")),  # 512x512
-            media.Movie(os.path.join(media_path, "video_with_tc.mov")),  # 256x256
+        shutil.copy(os.path.join(media_path, "img.png"), os.path.join(self.tempdir, "img.1001.png"))  # 64x64
+
+        # PNG header only, 128x32.
+        header = struct.pack(">IIBBBBB", 128, 32, 8, 2, 0, 0, 0)
+        with open(os.path.join(self.tempdir, "img.1002.png"), "wb") as image_file:
+            image_file.write(
+                b"\x89PNG\r\n\x1a\n" + struct.pack(">I", 13) + b"IHDR" + header
+                + struct.pack(">I", zlib.crc32(b"IHDR" + header))
+            )
+
+        img_sequence = media.ImageSequence(os.path.join(self.tempdir, "img.1001-1002#.png"))
+
+        with self.assertRaises(ValueError):
+            _ = img_sequence.validate()
+
+
+class TestImageSequenceValidate(unittest.TestCase):
+    """ Test lite_media_core.media.ImageSequence.validate.
+    """
+    def setUp(self):
+        """ Set up testing class.
+        """
+        super(TestImageSequenceValidate, self).setUp()
+        self.tempdir = tempfile.mkdtemp()
+        self.img_sequence = media.ImageSequence(os.path.join(self.tempdir, "img.1001-1010#.png"))
+
+        # Partially online sequence.
+        for frame in (1001, 1002, 1005):
+            open(os.path.join(self.tempdir, "img.%d.png" % frame), "a").close()  # touch file
+
+    def tearDown(self):
+        """ Tear down the testing class.
+        """
+        super(TestImageSequenceValidate, self).tearDown()
+        shutil.rmtree(self.tempdir)
+
+    def test_validate_workers_offline(self):
+        """ Ensure an offline sequence is valid when probed concurrently.
+        """
+        img_sequence = media.ImageSequence(os.path.join(self.tempdir, "offline.1001-1010#.png"))
+        report = img_sequence.validate(workers=4)
+
+        self.assertEqual((True, [], 10), (bool(report), report.errors, len(report.missing)))
+
+    def test_validate_not_a_directory(self):
+        """ Ensure a sequence whose directory is a file is reported as offline.
+        """
+        file_path = os.path.join(self.tempdir, "img.1001.png")
+        report = media.ImageSequence(os.path.join(file_path, "img.1001-1010#.png")).validate()
+
+        self.assertEqual((True, 10), (bool(report), len(report.missing)))
+
+    def test_validate_workers_missing(self):
+        """ Ensure a partially online sequence is reported when probed concurrently.
+        """
+        report = self.img_sequence.validate(strict=False, workers=4)
+        expected_missing = {
+            os.path.join(self.tempdir, "img.%d.png" % frame)
+            for frame in (1003, 1004, 1006, 1007, 1008, 1009, 1010)
+        }
+
+        self.assertEqual(
+            (False, expected_missing, None),
+            (report.valid, set(report.missing), report.reference_resolution),
+        )
+
+    def test_validate_workers_strict(self):
+        """ Ensure a partially online sequence raises on first failure when probed concurrently.
+        """
+        with self.assertRaises(ValueError):
+            self.img_sequence.validate(workers=4)
+
+    def test_validate_strict_report(self):
+        """ Ensure the error raised in strict mode lists all the missing frames and carries the report.
+        """
+        with self.assertRaises(ValueError) as context:
+            self.img_sequence.validate()
+
+        expected_missing = [
+            os.path.join(self.tempdir, "img.%d.png" % frame) for frame in (1003, 1004, 1006, 1007, 1008, 1009, 1010)
         ]
+        report = context.exception.report
+
+        self.assertEqual((False, expected_missing), (report.valid, sorted(report.missing)))
+        self.assertTrue(all(path in str(context.exception) for path in expected_missing))
+
+    def test_validate_executor(self):
+        """ Ensure a sequence can be probed through a provided executor, left open afterward.
+        """
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            report = self.img_sequence.validate(strict=False, executor=executor)
+            self.assertEqual(1, executor.submit(int, "1").result())
+
+        self.assertEqual(7, len(report.missing))
+
+    def test_validate_mismatched_resolutions(self):
+        """ Ensure frames with an inconsistent resolution are reported.
+        """
+        for frame in range(1001, 1011):
+            open(os.path.join(self.tempdir, "img.%d.png" % frame), "a").close()  # touch file
+
+        odd_frame = os.path.join(self.tempdir, "img.1007.png")
+
+        def _get_resolution(image_media):
+            """ Fake resolution, different for a single frame.
+            """
+            if image_media.path == odd_frame:
+                return resolution.Resolution(1024, 512)
+            return resolution.Resolution(2048, 1024)
+
+        with mock.patch.object(_image._image_media.ImageMedia, "resolution", property(_get_resolution)):
+            report = self.img_sequence.validate(strict=False, workers=3)
+
+            with self.assertRaises(ValueError):
+                self.img_sequence.validate(workers=3)
+
+        self.assertEqual(
+            (False, resolution.Resolution(2048, 1024), {odd_frame: resolution.Resolution(1024, 512)}),
+            (report.valid, report.reference_resolution, report.mismatched_resolutions),
+        )
+
+
+class TestSampling(unittest.TestCase):
+    """ Test lite_media_core.media.Sampling policies.
+    """
+    def setUp(self):
+        """ Set up testing class.
+        """
+        super(TestSampling, self).setUp()
+        self.frame_range = path_utils.sequence.FrameRange(1, 20, missing=[8, 9, 10])
+
+    def test_first_last(self):
+        """ Ensure first and last frames can be sampled.
+        """
+        self.assertEqual([1, 20], media.Sampling.first_last().select(self.frame_range))
+
+    def test_every(self):
+        """ Ensure every nth frame can be sampled.
+        """
+        self.assertEqual([1, 6, 14, 19], media.Sampling.every(5).select(self.frame_range))
+
+    def test_random(self):
+        """ Ensure random frames can be sampled, reproducible with a seed.
+        """
+        sampling = media.Sampling.random(5, seed=42)
+        frames = sampling.select(self.frame_range)
+
+        self.assertEqual(
+            (5, True, frames),
+            (len(frames), set(frames).issubset(self.frame_range), sampling.select(self.frame_range)),
+        )
+
+    def test_random_more_than_frames(self):
+        """ Ensure all frames are sampled when asking for more frames than available.
+        """
+        self.assertEqual(list(self.frame_range), media.Sampling.random(100).select(self.frame_range))
+
+    def test_stratified(self):
+        """ Ensure frames are sampled per sub-range.
+        """
+        frames = media.Sampling.stratified(2, seed=1).select(self.frame_range)
+
+        self.assertEqual(
+            (4, 2, 2),
+            (len(frames), len([frame for frame in frames if frame < 8]), len([frame for frame in frames if frame > 10])),
+        )
+
+    def test_invalid(self):
+        """ Ensure invalid sampling policies raise.
+        """
+        for policy, value in (
+            (media.Sampling.every, 0),
+            (media.Sampling.random, -1),
+            (media.Sampling.stratified, 0),
+        ):
+            with self.assertRaises(ValueError):
+                policy(value)
+
+
+class TestImageSequenceValidateSampling(unittest.TestCase):
+    """ Test lite_media_core.media.ImageSequence.validate with a sampling policy.
+    """
+    def setUp(self):
+        """ Set up testing class.
+        """
+        super(TestImageSequenceValidateSampling, self).setUp()
+        self.tempdir = tempfile.mkdtemp()
+        self.img_sequence = media.ImageSequence(os.path.join(self.tempdir, "img.1001-1100#.png"))
+
+    def tearDown(self):
+        """ Tear down the testing class.
+        """
+        super(TestImageSequenceValidateSampling, self).tearDown()
+        shutil.rmtree(self.tempdir)
+
+    def _touch(self, frames):
+        """ Helper, create empty frame files.
+        """
+        for frame in frames:
+            open(os.path.join(self.tempdir, "img.%d.png" % frame), "a").close()  # touch file
+
+    def test_sampling_offline(self):
+        """ Ensure an offline sequence is valid with a sampling policy.
+        """
+        report = self.img_sequence.validate(sampling=media.Sampling.first_last())
+        self.assertEqual((True, 100), (report.valid, len(report.missing)))
+
+    def test_sampling_missing(self):
+        """ Ensure existence is checked for every frame with a sampling policy.
+        """
+        self._touch(frame for frame in range(1001, 1101) if frame != 1050)
+        report = self.img_sequence.validate(strict=False, sampling=media.Sampling.first_last())
+
+        self.assertEqual(
+            (False, [os.path.join(self.tempdir, "img.1050.png")]),
+            (report.valid, report.missing),
+        )
 
         with self.assertRaises(ValueError):
-            _ = _image._validate_sequence(image_medias)  # pylint: disable=W0212
+            self.img_sequence.validate(sampling=media.Sampling.first_last())
+
+    def test_sampling_resolutions(self):
+        """ Ensure resolution is only probed on sampled frames.
+        """
+        self._touch(range(1001, 1101))
+        probed = []
+
+        def _get_resolution(image_media):
+            """ Fake resolution, keep track of probed frames.
+            """
+            probed.append(os.path.basename(image_media.path))
+            return resolution.Resolution(2048, 1024)
+
+        with mock.patch.object(_image._image_media.ImageMedia, "resolution", property(_get_resolution)):
+            report = self.img_sequence.validate(sampling=media.Sampling.every(25), workers=2)
+
+        self.assertEqual(
+            (True, ["img.1001.png", "img.1026.png", "img.1051.png", "img.1076.png"]),
+            (report.valid, sorted(probed)),
+        )
+
+
+class TestImageSequenceInheritInformation(unittest.TestCase):
+    """ Test lite_media_core.media.ImageSequence images information inheritance.
+    """
+    def setUp(self):
+        """ Set up testing class.
+        """
+        super(TestImageSequenceInheritInformation, self).setUp()
+        self.tempdir = tempfile.mkdtemp()
+
+        for frame in range(1001, 1006):
+            path = os.path.join(self.tempdir, "img.%d.png" % frame)
+            with open(path, "w") as file_:
+                file_.write("data")
+            os.utime(path, ns=(0, 0))
+
+        # Different content for the last frame.
+        path = os.path.join(self.tempdir, "img.1005.png")
+        with open(path, "w") as file_:
+            file_.write("different data")
+
+        self.sequence_path = os.path.join(self.tempdir, "img.1001-1005#.png")
+        patcher = mock.patch.object(
+            _image._image_media._media_info,
+            "get_media_information",
+            side_effect=lambda path: ({"width": 1920, "height": 1080}, {"Image": {"path": path}}),
+        )
+        self.get_media_information = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        """ Tear down the testing class.
+        """
+        super(TestImageSequenceInheritInformation, self).tearDown()
+        shutil.rmtree(self.tempdir)
+
+    def test_inherit_information(self):
+        """ Ensure images reuse the sequence information when identical on disk.
+        """
+        img_sequence = media.ImageSequence(self.sequence_path)
+        metadata = [image.metadata for image in img_sequence[:4]]
+
+        self.assertEqual(
+            ([{"Image": {"path": os.path.join(self.tempdir, "img.1001.png")}}] * 4, 1),
+            (metadata, self.get_media_information.call_count),
+        )
+
+    def test_inherit_information_different_frame(self):
+        """ Ensure an image gathers its own information when it differs from the sequence first frame.
+        """
+        img_sequence = media.ImageSequence(self.sequence_path)
+        last_frame = os.path.join(self.tempdir, "img.1005.png")
+
+        self.assertEqual(
+            ({"Image": {"path": last_frame}}, 1),
+            (img_sequence[-1].metadata, self.get_media_information.call_count),
+        )
+
+    def test_inherit_information_chunks(self):
+        """ Ensure images from chunks reuse the original sequence information.
+        """
+        img_sequence = media.ImageSequence(self.sequence_path)
+        images = [image for chunk in img_sequence.chunk(2)[:2] for image in chunk]
+        for image in images:
+            _ = image.resolution
+
+        self.assertEqual(1, self.get_media_information.call_count)
+
+    def test_no_inherit_information(self):
+        """ Ensure each image gathers its own information when inheritance is disabled.
+        """
+        img_sequence = media.ImageSequence(self.sequence_path, inherit_information=False)
+        for image in img_sequence:
+            _ = image.metadata
+
+        self.assertEqual(5, self.get_media_information.call_count)
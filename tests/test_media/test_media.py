@@ -4,6 +4,7 @@ import os
 import unittest
 
 from lite_media_core import media
+from lite_media_core import path_utils
 
 
 class TestMedia(unittest.TestCase):
@@ -186,3 +187,32 @@ class TestMediaFromPath(unittest.TestCase):
         # Shall this later be a MovieSequence ?
         media_obj = media.Media.from_path("/path/to/a/video/file_0000-1001#.mov")
         self.assertIsInstance(media_obj, media.Movie)
+
+    def test_from_sequence(self):
+        """ Ensure an ImageSequence object is created from a Sequence, keeping its frames.
+        """
+        seq = path_utils.Sequence.from_list(["/path/to/a/sequence/files.%04d.png" % frame for frame in (1, 5, 6)])
+        media_obj = media.Media.from_sequence(seq)
+
+        self.assertIsInstance(media_obj, media.ImageSequence)
+        self.assertEqual(
+            ["files.0001.png", "files.0005.png", "files.0006.png"],
+            [os.path.basename(image.path) for image in media_obj],
+        )
+
+    def test_from_sequence_single_frame(self):
+        """ Ensure a single frame Sequence is identified like its frame path.
+        """
+        seq = path_utils.Sequence.from_list(["/path/to/a/video/file.0001.mov"])
+        media_obj = media.Media.from_sequence(seq)
+
+        self.assertIsInstance(media_obj, media.Movie)
+        self.assertEqual("/path/to/a/video/file.0001.mov", media_obj.path)
+
+    def test_from_sequence_unsupported(self):
+        """ Ensure a Media cannot be created from a Sequence of non image files.
+        """
+        seq = path_utils.Sequence.from_list(["/path/to/a/video/file.0001.mov", "/path/to/a/video/file.0002.mov"])
+
+        with self.assertRaises(media.UnsupportedMimeType):
+            _ = media.Media.from_sequence(seq)
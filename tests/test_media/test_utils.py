@@ -1,3 +1,6 @@
+import os
+import shutil
+import tempfile
 import unittest
 
 from lite_media_core import media
@@ -49,3 +52,117 @@ class TestUtils(unittest.TestCase):
             chunks,
             [image_sequence]
         )
+
+    def test_chunk_missing_frames(self):
+        """ Ensure chunks are computed from existing frames only.
+        """
+        image_sequence = media.ImageSequence('sequence.%04d.exr 1-10 ([3, 4, 5])')
+        chunks = image_sequence.chunk(3)
+
+        self.assertEqual(
+            [[1, 2, 6], [7, 8, 9], [10]],
+            [list(chunk.frame_range) for chunk in chunks],
+        )
+        self.assertEqual(
+            [media.ImageSequence, media.ImageSequence, media.Image],
+            [type(chunk) for chunk in chunks],
+        )
+
+    def test_chunk_share_information(self):
+        """ Ensure chunks share the image sequence media information.
+        """
+        image_sequence = media.ImageSequence('sequence.%04d.exr 1001-1010')
+        image_sequence._info = {"width": 1920, "height": 1080}  # pylint: disable=protected-access
+        image_sequence._metadata = {"Image": {"format": "EXR"}}  # pylint: disable=protected-access
+
+        self.assertEqual(
+            [{"Image": {"format": "EXR"}}] * 2,
+            [chunk.metadata for chunk in image_sequence.chunk(5)],
+        )
+
+    def test_chunk_invalid(self):
+        """ Ensure an invalid chunk size raises.
+        """
+        image_sequence = media.ImageSequence('sequence.%04d.exr 1001-1010')
+
+        for chunk_size in (0, -1, 1.5):
+            with self.assertRaises(ValueError):
+                image_sequence.chunk(chunk_size)
+
+    def test_partition_frames(self):
+        """ Ensure an image sequence can be partitioned by amount of frames.
+        """
+        image_sequence = media.ImageSequence('sequence.%04d.exr 1-10 ([3, 4, 5])')
+        partitions = image_sequence.partition(3)
+
+        self.assertEqual(
+            [[1, 2], [6, 7], [8, 9, 10]],
+            [list(partition.frame_range) for partition in partitions],
+        )
+
+    def test_partition_invalid(self):
+        """ Ensure an invalid partition count or mode raises.
+        """
+        image_sequence = media.ImageSequence('sequence.%04d.exr 1001-1010')
+
+        for count in (0, -1, 1.5):
+            with self.assertRaises(ValueError):
+                image_sequence.partition(count)
+
+        with self.assertRaises(ValueError):
+            image_sequence.partition(2, by="size")
+
+
+class TestPartitionBytes(unittest.TestCase):
+    """ Test lite_media_core.media.ImageSequence.partition by bytes.
+    """
+
+    def setUp(self):
+        """ Set up testing class.
+        """
+        super(TestPartitionBytes, self).setUp()
+        self.tempdir = tempfile.mkdtemp()
+
+        # Two detailed frames in the middle of the sequence, 1011-1012 are missing.
+        for frame, size in zip(range(1001, 1011), (100, 100, 100, 100, 1000, 1000, 100, 100, 100, 100)):
+            with open(os.path.join(self.tempdir, "img.%d.png" % frame), "wb") as file_:
+                file_.write(b"0" * size)
+
+        self.image_sequence = media.ImageSequence(os.path.join(self.tempdir, "img.1001-1012#.png"))
+
+    def tearDown(self):
+        """ Tear down the testing class.
+        """
+        super(TestPartitionBytes, self).tearDown()
+        shutil.rmtree(self.tempdir)
+
+    def test_partition_bytes(self):
+        """ Ensure an image sequence can be partitioned by amount of bytes.
+        """
+        partitions = self.image_sequence.partition(2, by="bytes")
+
+        self.assertEqual(
+            [list(range(1001, 1006)), list(range(1006, 1013))],
+            [list(partition.frame_range) for partition in partitions],
+        )
+
+    def test_partition_bytes_single_frames(self):
+        """ Ensure single frame partitions by amount of bytes are images, and never empty.
+        """
+        partitions = self.image_sequence.partition(4, by="bytes")
+
+        self.assertEqual(
+            [media.ImageSequence, media.Image, media.Image, media.ImageSequence],
+            [type(partition) for partition in partitions],
+        )
+        self.assertEqual(12, len(self.image_sequence.partition(20, by="bytes")))
+
+    def test_partition_bytes_offline(self):
+        """ Ensure an offline image sequence is partitioned by amount of frames.
+        """
+        image_sequence = media.ImageSequence(os.path.join(self.tempdir, "offline.1001-1010#.png"))
+
+        self.assertEqual(
+            [list(range(1001, 1006)), list(range(1006, 1011))],
+            [list(partition.frame_range) for partition in image_sequence.partition(2, by="bytes")],
+        )
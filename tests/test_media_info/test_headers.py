@@ -0,0 +1,88 @@
+""" Test lite_media_core._media_info._headers module.
+"""
+import os
+import struct
+import tempfile
+import unittest
+
+from lite_media_core._media_info import _headers
+
+
+_mediaPath = os.path.join(
+    os.path.dirname(__file__),
+    "..",
+    "resources",
+    "media",
+)
+
+
+class TestHeaders(unittest.TestCase):
+    """ Test pure python image header readers.
+    """
+
+    def test_exr(self):
+        """ Ensure the resolution can be read from an exr header.
+        """
+        self.assertEqual((64, 64, 1.0), _headers.read_resolution(os.path.join(_mediaPath, "img.exr")))
+
+    def test_exr_anamorphic(self):
+        """ Ensure the pixel aspect ratio can be read from an exr header.
+        """
+        self.assertEqual((64, 64, 2.0), _headers.read_resolution(os.path.join(_mediaPath, "img-anamorphic.exr")))
+
+    def test_dpx(self):
+        """ Ensure the resolution can be read from a dpx header.
+        """
+        self.assertEqual((64, 64, 1.0), _headers.read_resolution(os.path.join(_mediaPath, "img.dpx")))
+
+    def test_dpx_anamorphic(self):
+        """ Ensure the pixel aspect ratio can be read from a dpx header.
+        """
+        self.assertEqual((64, 64, 2.0), _headers.read_resolution(os.path.join(_mediaPath, "img-anamorphic.dpx")))
+
+    def test_png(self):
+        """ Ensure the resolution can be read from a png header.
+        """
+        self.assertEqual((64, 64, 1.0), _headers.read_resolution(os.path.join(_mediaPath, "img.png")))
+
+    def test_jpg(self):
+        """ Ensure the resolution can be read from a jpeg header.
+        """
+        self.assertEqual((64, 64, 1.0), _headers.read_resolution(os.path.join(_mediaPath, "img.jpg")))
+
+    def test_tiff(self):
+        """ Ensure the resolution can be read from a tiff header.
+        """
+        self.assertEqual((64, 64, 1.0), _headers.read_resolution(os.path.join(_mediaPath, "img.tiff")))
+
+    def test_tiff_big_endian(self):
+        """ Ensure the resolution can be read from a big endian tiff header.
+        """
+        entries = struct.pack(">HHIHH", 256, 3, 1, 1920, 0) + struct.pack(">HHII", 257, 4, 1, 1080)
+        with tempfile.NamedTemporaryFile(suffix=".tif", delete=False) as tmpFile:
+            tmpFile.write(b"MM\0*" + struct.pack(">IH", 8, 2) + entries)
+
+        try:
+            self.assertEqual((1920, 1080, 1.0), _headers.read_resolution(tmpFile.name))
+        finally:
+            os.remove(tmpFile.name)
+
+    def test_unsupported_format(self):
+        """ Ensure None is returned for formats without header reader.
+        """
+        for name in ("img.jp2", "video.mov", "sample.mp3"):
+            self.assertIsNone(_headers.read_resolution(os.path.join(_mediaPath, name)))
+
+    def test_invalid_header(self):
+        """ Ensure None is returned for files with an invalid header, or offline files.
+        """
+        with tempfile.NamedTemporaryFile(suffix=".exr", delete=False) as tmpFile:
+            tmpFile.write(b"not an exr file")
+
+        try:
+            self.assertEqual(
+                (None, None),
+                (_headers.read_resolution(tmpFile.name), _headers.read_resolution("/path/to/offline/img.exr")),
+            )
+        finally:
+            os.remove(tmpFile.name)
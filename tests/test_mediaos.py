@@ -4,10 +4,12 @@ import os
 import tempfile
 import unittest
 import shutil
+from unittest import mock
 
 
 from lite_media_core import media
 from lite_media_core import mediaos
+from lite_media_core import path_utils
 
 
 class TestWalk(unittest.TestCase):
@@ -157,6 +159,26 @@ class TestListDir(unittest.TestCase):
         self.assertEqual(len(medias), 2)
         self.assertEqual(len(non_medias), 1)
 
+    def test_listdir_image_not_sequence(self):
+        """ Ensure a standalone image whose name does not look like a sequence is an Image.
+        """
+        for name in ("b1.png", "a-0004.jpg"):
+            open(os.path.join(self.root, name), "a").close()  # touch file
+
+        images = {
+            os.path.basename(item.path): type(item)
+            for item in mediaos.listdir(self.root)
+            if isinstance(item, (media.Image, media.ImageSequence))
+        }
+        self.assertEqual({"b1.png": media.Image, "a-0004.jpg": media.Image}, images)
+
+        walked_images = {
+            os.path.basename(item.path): type(item)
+            for item in next(mediaos.walk(self.root))[2]
+            if isinstance(item, (media.Image, media.ImageSequence))
+        }
+        self.assertEqual(images, walked_images)
+
 
 class TestListDirSequence(unittest.TestCase):
     """ Test mediaos.listdir feature with an image sequence.
@@ -192,3 +214,20 @@ class TestListDirSequence(unittest.TestCase):
         sequence = items[0]
         self.assertIsInstance(sequence, media.ImageSequence)
         self.assertTrue(sequence.path.endswith("img_seq.####.exr 1001-1003"))
+
+    def test_listdir_sequence_not_parsed(self):
+        """ Ensure listdir creates the ImageSequence from the detected sequence, without parsing its path again.
+        """
+        os.remove(os.path.join(self.root, "img_seq.1002.exr"))
+
+        with mock.patch.object(
+            path_utils.Sequence, "from_string", wraps=path_utils.Sequence.from_string
+        ) as from_string:
+            items = mediaos.listdir(self.root)
+
+        from_string.assert_not_called()
+        self.assertEqual(1, len(items))
+        self.assertEqual(
+            ["img_seq.1001.exr", "img_seq.1003.exr"],
+            [os.path.basename(image.path) for image in items[0]],
+        )
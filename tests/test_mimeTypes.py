@@ -3,6 +3,9 @@
 import os
 import unittest
 
+from unittest import mock
+
+from lite_media_core.path_utils import mime_types
 from lite_media_core.path_utils.mime_types import mimetypes
 
 
@@ -80,3 +83,75 @@ class TestAdditionalMimeTypes(unittest.TestCase):
         mimeType, _ = mimetypes.guess_type(psdFile)
 
         self.assertEqual("image/vnd.adobe.photoshop", mimeType)
+
+
+class TestGuessType(unittest.TestCase):
+    """ Test the lite_media_core private mime-types resolver.
+    """
+    def test_guess_type(self):
+        """ Ensure standard and additional mime-types are resolved.
+        """
+        self.assertEqual(
+            ("image/png", "image/x-exr", "video/quicktime"),
+            (
+                mime_types.guess_type(os.path.join(_mediaPath, "img.png"))[0],
+                mime_types.guess_type(os.path.join(_mediaPath, "img.exr"))[0],
+                mime_types.guess_type(os.path.join(_mediaPath, "video.mov"))[0],
+            ),
+        )
+
+    def test_guess_type_encoding(self):
+        """ Ensure compressed files are not confused with their plain extension.
+        """
+        self.assertEqual(("image/x-exr", "gzip"), mime_types.guess_type("img.exr.gz"))
+        self.assertEqual(("image/x-exr", None), mime_types.guess_type("img.exr"))
+
+    def test_guess_type_unknown(self):
+        """ Ensure unknown paths are resolved to None.
+        """
+        self.assertEqual(
+            (None, None, None),
+            (
+                mime_types.guess_type("file.unknown_ext")[0],
+                mime_types.guess_type("/path/to/file")[0],
+                mime_types.guess_type("img.####.exr 1-10")[0],
+            ),
+        )
+
+    def test_guess_type_cached(self):
+        """ Ensure guessed types are cached per extension.
+        """
+        mime_types.guess_type("img.dpx")
+        self.assertIn(".dpx", mime_types._CACHE)  # pylint: disable=protected-access
+
+    def test_guess_type_not_cached(self):
+        """ Ensure extensions of sequence strings are not cached, so the cache does not grow per frame range.
+        """
+        mime_types.invalidate()
+        for end in range(2, 100):
+            mime_types.guess_type("img.####.exr 1-%d" % end)
+
+        self.assertEqual({}, mime_types._CACHE)  # pylint: disable=protected-access
+        self.assertEqual((None, None), mime_types.guess_type("img.####.exr 1-10"))
+
+    def test_guess_type_cache_bounded(self):
+        """ Ensure the cache does not grow past its size (ex: frame numbers as extensions).
+        """
+        mime_types.invalidate()
+        with mock.patch.object(mime_types, "_CACHE_SIZE", 10):
+            for frame in range(100):
+                mime_types.guess_type("img.%04d" % frame)
+
+        self.assertEqual(10, len(mime_types._CACHE))  # pylint: disable=protected-access
+
+    def test_invalidate(self):
+        """ Ensure the database and cache can be invalidated then reloaded.
+        """
+        mime_types.guess_type("img.dpx")
+        mime_types.invalidate()
+
+        self.assertEqual(
+            ({}, None),
+            (mime_types._CACHE, mime_types._DATABASE),  # pylint: disable=protected-access
+        )
+        self.assertEqual("image/x-dpx", mime_types.guess_type("img.dpx")[0])
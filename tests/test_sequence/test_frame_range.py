@@ -1,11 +1,18 @@
 """ Test out the lite_media_core.path_utils.sequence._frameRange module.
 """
+import copy
 import itertools
+import json
+import pickle
 import unittest
 
+from importlib import util as _impt_util
+from unittest import mock
+
 import fileseq
 
 from lite_media_core.path_utils import sequence
+from lite_media_core.path_utils.sequence import _frame_range
 
 
 class TestFrameRange(unittest.TestCase):
@@ -45,6 +52,47 @@ class TestFrameRange(unittest.TestCase):
         self.assertEqual(2, len({frameRange1, frameRange2, frameRange3}))
         self.assertEqual({frameRange1, frameRange2, frameRange3}, {frameRange1, frameRange3})
 
+    def test_equalityStructural(self):
+        """ Ensure FrameRange objects are compared by fields.
+        """
+        frameRange = sequence.FrameRange(1, 100000, missing=range(2, 100000, 2))
+
+        self.assertEqual(frameRange, sequence.FrameRange.from_string(str(frameRange)))
+        self.assertNotEqual(frameRange, sequence.FrameRange(1, 100000, padding=8, missing=range(2, 100000, 2)))
+        self.assertNotEqual(frameRange, sequence.FrameRange(1, 100000, missing=range(4, 100000, 2)))
+        self.assertNotEqual(frameRange, repr(frameRange))
+
+    def test_equalityFrameSet(self):
+        """ Ensure a FrameRange is never equal to a fileseq FrameSet, which hashes differently.
+        """
+        frameRange = sequence.FrameRange(1, 10, padding=4, missing=[2, 3])
+
+        self.assertNotEqual(frameRange, fileseq.FrameSet("1,4-10"))
+        self.assertNotEqual(frameRange, fileseq.FrameSet("1-10"))
+        self.assertIsNone({fileseq.FrameSet("1,4-10"): 1}.get(frameRange))
+
+    def test_immutable(self):
+        """ Ensure a FrameRange cannot be modified.
+        """
+        frameRange = sequence.FrameRange(1, 5, padding=4, missing=[2, 3])
+
+        with self.assertRaises(AttributeError):
+            frameRange._start = 2  # pylint: disable=protected-access
+
+        with self.assertRaises(AttributeError):
+            frameRange.frames = [1, 2]
+
+        with self.assertRaises(AttributeError):
+            del frameRange._padding  # pylint: disable=protected-access
+
+    def test_copy(self):
+        """ Ensure a FrameRange can be copied and pickled.
+        """
+        frameRange = sequence.FrameRange(1, 21, padding=4, step=5, missing=[11])
+
+        self.assertEqual(frameRange, copy.deepcopy(frameRange))
+        self.assertEqual(frameRange, pickle.loads(pickle.dumps(frameRange)))
+
     def test_iter(self):
         """ Ensure a FrameRange can be iterated over.
         """
@@ -101,6 +149,25 @@ class TestFrameRange(unittest.TestCase):
         self.assertEqual(str(sequence.FrameRange(1, 1001, step=50)), "1-1001x50")
         self.assertEqual(str(sequence.FrameRange(1, 14, missing=[5, 6, 7, 11])), "1-4, 8-10, 12-14")
 
+    def test_asStringEmpty(self):
+        """ Ensure an empty FrameRange is converted to an empty string.
+        """
+        self.assertEqual("", str(sequence.FrameRange(1, 1, missing=[1])))
+
+    def test_asStringRoundTrip(self):
+        """ Ensure a FrameRange string representation can be parsed back to the same FrameRange.
+        """
+        for frameRange in (
+            sequence.FrameRange(1, 10000000, missing=[5, 6, 5000000]),
+            sequence.FrameRange(-10, -4, missing=[-5]),
+            sequence.FrameRange(1, 1001, step=2, missing=[3, 501]),
+        ):
+            self.assertEqual(frameRange, sequence.FrameRange.from_string(str(frameRange)))
+
+        self.assertEqual(
+            "1-4, 7-4999999, 5000001-10000000", str(sequence.FrameRange(1, 10000000, missing=[5, 6, 5000000])),
+        )
+
     def test_from_string(self):
         """ Ensure a FrameRange can be created from a frame list string representation.
         """
@@ -271,3 +338,247 @@ class TestFrameRange(unittest.TestCase):
         expected = [sequence.FrameRange(10, 14, padding=4), sequence.FrameRange(17, 20, padding=4)]
 
         self.assertEqual(expected, subRanges)
+
+    def test_len(self):
+        """ Ensure a FrameRange length is its number of frames.
+        """
+        self.assertEqual(5, len(sequence.FrameRange(1, 5)))
+        self.assertEqual(3, len(sequence.FrameRange(1, 5, missing=[2, 3])))
+        self.assertEqual(3, len(sequence.FrameRange(1, 10, step=4)))
+        self.assertEqual(0, len(sequence.FrameRange(1, 1, missing=[1])))
+
+    def test_contains(self):
+        """ Ensure frame membership can be checked on a FrameRange.
+        """
+        frameRange = sequence.FrameRange(10, 30, step=2, missing=[14, 24, 26])
+
+        self.assertIn(10, frameRange)
+        self.assertIn(30, frameRange)
+        self.assertNotIn(11, frameRange)
+        self.assertNotIn(14, frameRange)
+        self.assertNotIn(32, frameRange)
+        self.assertNotIn("10", frameRange)
+
+    def test_missingNormalized(self):
+        """ Ensure missing frames are sorted, unique and limited to the FrameRange frames.
+        """
+        frameRange = sequence.FrameRange(1, 9, step=2, missing=[7, 3, 3, 4, 0, 11])
+        self.assertEqual([3, 7], frameRange.missing)
+        self.assertEqual([1, 5, 9], list(frameRange))
+
+    def test_missingList(self):
+        """ Ensure missing frames compare to lists by frames, and can be converted to a regular list.
+        """
+        missing = sequence.FrameRange(1, 10, missing=[3, 4]).missing
+
+        self.assertEqual([3, 4], missing)
+        self.assertEqual((3, 4), missing)
+        self.assertNotEqual(["a", "b"], missing)
+        self.assertNotEqual([3.0, 4.5], missing)
+        self.assertNotEqual([3, 4, 5], missing)
+        self.assertEqual("[3, 4]", json.dumps(list(missing)))
+
+    def test_largeRange(self):
+        """ Ensure large ranges are not expanded frame by frame.
+        """
+        frameRange = sequence.FrameRange.from_string("1-1000000000, 1000000005")
+
+        self.assertEqual(1000000001, len(frameRange))
+        self.assertIn(999999999, frameRange)
+        self.assertEqual([1000000001, 1000000002, 1000000003, 1000000004], frameRange.missing)
+        self.assertEqual([1, 2, 3], list(itertools.islice(frameRange, 3)))
+        self.assertEqual(2, len(list(frameRange.iter_ranges())))
+
+    def test_union(self):
+        """ Ensure the union of FrameRange objects merges their frames.
+        """
+        frameRange1 = sequence.FrameRange(1, 10, missing=[3, 4])
+        frameRange2 = sequence.FrameRange(4, 20, padding=4, missing=[15])
+
+        self.assertEqual(sequence.FrameRange(1, 20, padding=4, missing=[3, 15]), frameRange1 | frameRange2)
+        self.assertEqual(frameRange1 | frameRange2, frameRange1.union(frameRange2))
+        self.assertEqual(sequence.FrameRange(1, 12, missing=[3, 4, 11]), frameRange1.union([12]))
+
+    def test_intersection(self):
+        """ Ensure the intersection of FrameRange objects keeps their common frames.
+        """
+        frameRange1 = sequence.FrameRange(1, 10, missing=[3, 4])
+        frameRange2 = sequence.FrameRange(4, 20, missing=[8])
+
+        self.assertEqual(sequence.FrameRange(5, 10, missing=[8]), frameRange1 & frameRange2)
+        self.assertEqual(frameRange1 & frameRange2, frameRange1.intersection(frameRange2))
+
+    def test_difference(self):
+        """ Ensure the difference of FrameRange objects removes the other frames.
+        """
+        expected = sequence.FrameRange(1, 1001)
+        rendered = sequence.FrameRange(1, 1001, missing=[10, 11, 500])
+
+        self.assertEqual(sequence.FrameRange(10, 500, padding=4, missing=range(12, 500)), expected - rendered)
+        self.assertEqual(expected - rendered, expected.difference(rendered))
+        self.assertEqual(0, len(rendered - expected))
+
+    def test_symmetricDifference(self):
+        """ Ensure the symmetric difference of FrameRange objects keeps the frames in only one of them.
+        """
+        frameRange1 = sequence.FrameRange(1, 10)
+        frameRange2 = sequence.FrameRange(5, 15)
+
+        self.assertEqual([1, 2, 3, 4, 11, 12, 13, 14, 15], list(frameRange1 ^ frameRange2))
+        self.assertEqual(frameRange1 ^ frameRange2, frameRange1.symmetric_difference(frameRange2))
+
+    def test_setOperationsStep(self):
+        """ Ensure set operations keep the step only when both FrameRange objects share the same stepped frames.
+        """
+        frameRange1 = sequence.FrameRange(1, 21, step=5, missing=[11])
+        frameRange2 = sequence.FrameRange(11, 31, step=5)
+
+        self.assertEqual(sequence.FrameRange(1, 31, step=5), frameRange1 | frameRange2)
+        self.assertEqual(
+            sequence.FrameRange(1, 21, missing=[7, 8, 9, 10, 11, 12, 13, 14, 15, 17, 18, 19, 20]),
+            frameRange1 | sequence.FrameRange(2, 5),
+        )
+
+    def test_setOperationsInvalid(self):
+        """ Ensure set operators only support FrameRange objects.
+        """
+        with self.assertRaises(TypeError):
+            _ = sequence.FrameRange(1, 10) | [11]
+
+        with self.assertRaises(ValueError):
+            sequence.FrameRange(1, 10).union(1.2)
+
+    def test_getitem(self):
+        """ Ensure a FrameRange frame can be retrieved from its position.
+        """
+        frameRange = sequence.FrameRange(10, 30, step=2, missing=[14, 24, 26])
+
+        self.assertEqual(10, frameRange[0])
+        self.assertEqual(16, frameRange[2])
+        self.assertEqual(30, frameRange[-1])
+        self.assertEqual(28, frameRange[-2])
+
+        with self.assertRaises(IndexError):
+            _ = frameRange[8]
+
+    def test_getitemSlice(self):
+        """ Ensure a FrameRange can be sliced by positions into a FrameRange.
+        """
+        frameRange = sequence.FrameRange(1, 1000000, padding=4, missing=[10])
+
+        self.assertEqual(sequence.FrameRange(5002, 6000, padding=4), frameRange[5000:5999])
+        self.assertEqual(sequence.FrameRange(8, 11, padding=4, missing=[10]), frameRange[7:10])
+        self.assertEqual(sequence.FrameRange(999991, 1000000, padding=4), frameRange[-10:])
+        self.assertEqual(sequence.FrameRange(1, 5, step=2, padding=4), frameRange[0:5:2])
+        self.assertEqual([1, 4, 7, 11], list(frameRange[0:12:3]))
+        self.assertEqual(0, len(frameRange[10:5]))
+
+        with self.assertRaises(ValueError):
+            _ = frameRange[::-1]
+
+    def test_index(self):
+        """ Ensure the position of a frame can be retrieved from a FrameRange.
+        """
+        frameRange = sequence.FrameRange(10, 30, step=2, missing=[14, 24, 26])
+
+        self.assertEqual(0, frameRange.index(10))
+        self.assertEqual(4, frameRange.index(20))
+        self.assertEqual(7, frameRange.index(30))
+
+        for frame in (14, 15, 32, "10"):
+            with self.assertRaises(ValueError):
+                frameRange.index(frame)
+
+    def test_partition(self):
+        """ Ensure a FrameRange can be partitioned into nearly equal consecutive units.
+        """
+        frameRange = sequence.FrameRange(1, 100, padding=4, missing=[10, 11, 50])
+
+        self.assertEqual(
+            [
+                sequence.FrameRange(1, 26, padding=4, missing=[10, 11]),
+                sequence.FrameRange(27, 51, padding=4, missing=[50]),
+                sequence.FrameRange(52, 75, padding=4),
+                sequence.FrameRange(76, 100, padding=4),
+            ],
+            frameRange.partition(4),
+        )
+        self.assertEqual(["1", "2", "3"], [str(unit) for unit in sequence.FrameRange(1, 3).partition(5)])
+        self.assertEqual([], sequence.FrameRange(1, 1, missing=[1]).partition(2))
+
+    def test_partitionRespectGaps(self):
+        """ Ensure a FrameRange can be partitioned into units that never span a gap.
+        """
+        frameRange = sequence.FrameRange(1, 100, missing=[10, 11, 50])
+
+        self.assertEqual(
+            ["1-9", "12-49", "51-75", "76-100"], [str(unit) for unit in frameRange.partition(4, respect_gaps=True)],
+        )
+        self.assertEqual(
+            ["1-2", "4-5", "7-8", "10"],
+            [str(unit) for unit in sequence.FrameRange(1, 10, missing=[3, 6, 9]).partition(2, respect_gaps=True)],
+        )
+
+    def test_partitionInterleave(self):
+        """ Ensure a FrameRange can be partitioned into interleaved units.
+        """
+        frameRange = sequence.FrameRange(1, 1001, padding=4)
+
+        self.assertEqual(
+            [
+                sequence.FrameRange(1, 1000, padding=4, step=3),
+                sequence.FrameRange(2, 1001, padding=4, step=3),
+                sequence.FrameRange(3, 999, padding=4, step=3),
+            ],
+            frameRange.partition(3, interleave=True),
+        )
+        frameRange = sequence.FrameRange(1, 8, missing=[3, 6])
+        self.assertEqual(["1, 4, 7", "2, 5, 8"], [str(unit) for unit in frameRange.partition(2, interleave=True)])
+
+    def test_partitionInvalid(self):
+        """ Ensure invalid inputs will raise a ValueError in partition().
+        """
+        with self.assertRaises(ValueError):
+            sequence.FrameRange(1, 10).partition(0)
+
+        with self.assertRaises(ValueError):
+            sequence.FrameRange(1, 10).partition(2, respect_gaps=True, interleave=True)
+
+    @unittest.skipUnless(_impt_util.find_spec("numpy"), "numpy is not installed.")
+    def test_to_numpy(self):
+        """ Ensure a FrameRange can be converted to a numpy array.
+        """
+        array = sequence.FrameRange(10, 30, step=2, missing=[14, 24, 26]).to_numpy()
+
+        self.assertEqual("int64", array.dtype.name)
+        self.assertEqual([10, 12, 16, 18, 20, 22, 28, 30], array.tolist())
+        self.assertEqual([], sequence.FrameRange(1, 1, missing=[1]).to_numpy().tolist())
+
+    @unittest.skipUnless(_impt_util.find_spec("numpy"), "numpy is not installed.")
+    def test_from_numpy(self):
+        """ Ensure a FrameRange can be created from a numpy array.
+        """
+        numpy = _frame_range._import_numpy()  # pylint: disable=protected-access
+        frameRange = sequence.FrameRange(1, 1000000, padding=4, missing=[3, 500, 501])
+
+        self.assertEqual(frameRange, sequence.FrameRange.from_numpy(frameRange.to_numpy(), padding=4))
+        self.assertEqual(
+            sequence.FrameRange(1, 21, step=5, missing=[11]),
+            sequence.FrameRange.from_numpy(numpy.array([21, 1, 16, 6, 6]), step=5),
+        )
+
+        with self.assertRaises(ValueError):
+            sequence.FrameRange.from_numpy(numpy.array([1, 2]), step=5)
+
+        with self.assertRaises(ValueError):
+            sequence.FrameRange.from_numpy(numpy.array([]))
+
+    def test_numpyUnavailable(self):
+        """ Ensure numpy conversions raise when numpy is not installed.
+        """
+        with mock.patch.object(_frame_range._impt_util, "find_spec", return_value=None):
+            with self.assertRaises(RuntimeError):
+                sequence.FrameRange(1, 10).to_numpy()
+
+            with self.assertRaises(RuntimeError):
+                sequence.FrameRange.from_numpy([1, 2])
@@ -5,9 +5,13 @@ import shutil
 import tempfile
 import unittest
 
+from importlib import util as _impt_util
+from unittest import mock
+
 import fileseq
 
 from lite_media_core.path_utils import sequence
+from lite_media_core.path_utils.sequence import _sequence
 
 
 class TestSequenceAbsolute(unittest.TestCase):
@@ -132,6 +136,34 @@ class TestSequenceAbsolute(unittest.TestCase):
             },
         )
 
+    def test_equalsPadding(self):
+        """ Ensure sequences with the same paths are equal, whatever their padding.
+        """
+        self.assertEqual(
+            sequence.Sequence.from_string("/path/to/a/file.%d.ext 1001-1005"),
+            sequence.Sequence.from_string("/path/to/a/file.%04d.ext 1001-1005"),
+        )
+        self.assertNotEqual(
+            sequence.Sequence.from_string("/path/to/a/file.%d.ext 1-1005"),
+            sequence.Sequence.from_string("/path/to/a/file.%04d.ext 1-1005"),
+        )
+        self.assertNotEqual(
+            sequence.Sequence.from_string("/path/to/a/file.%d.ext", allow_empty=True),
+            sequence.Sequence.from_string("/path/to/a/other.%d.ext", allow_empty=True),
+        )
+
+    def test_hashLargeSequence(self):
+        """ Ensure large sequences are hashed and compared without building their paths.
+        """
+        seq1 = sequence.Sequence.from_string("/path/to/a/file.%04d.ext 1-100000")
+        seq2 = sequence.Sequence.from_string("/path/to/a/file.%04d.ext 1-100000")
+
+        with mock.patch.object(_sequence.os.path, "abspath", wraps=os.path.abspath) as abspath:
+            self.assertEqual(1, len({seq1, seq2}))
+            self.assertEqual(seq1, seq2)
+
+        self.assertEqual(2, abspath.call_count)
+
     def test_frame_range(self):
         """ Ensure a frame_range can be retrieved from a Sequence.
         """
@@ -141,6 +173,34 @@ class TestSequenceAbsolute(unittest.TestCase):
             (1001, 1005, 4, []), (frame_range.start, frame_range.end, frame_range.padding, frame_range.missing,),
         )
 
+    def test_memoizedProperties(self):
+        """ Ensure the Sequence derived properties are only computed once.
+        """
+        seq = sequence.Sequence.from_string(self._sequence_basename + "%04d.ext 1001-1005 ([1003])")
+
+        with mock.patch.object(seq._data, "frameSet", wraps=seq._data.frameSet) as frame_set:  # pylint: disable=protected-access
+            for _ in range(2):
+                self.assertEqual(4, seq.padding)
+                self.assertEqual([self._sequence_basename + "1003.ext"], seq.missing)
+                self.assertEqual(sequence.FrameRange(1001, 1005, padding=4, missing=[1003]), seq.frame_range)
+                self.assertEqual(
+                    self._sequence_basename + "####.ext 1001-1005",
+                    seq.format(sequence.PredefinedFormat.LEGACY_HASHTAG_EXTENDED),
+                )
+
+            self.assertEqual(0, frame_set.call_count)  # answered from the Sequence frame range
+
+        seq.missing.append("path")
+        self.assertEqual([self._sequence_basename + "1003.ext"], seq.missing)
+
+    @unittest.skipUnless(_impt_util.find_spec("numpy"), "numpy is not installed.")
+    def test_frames_array(self):
+        """ Ensure the Sequence frames can be retrieved as a numpy array.
+        """
+        seq = sequence.Sequence.from_string(self._sequence_basename + "%04d.ext 1001-1005 ([1003])")
+
+        self.assertEqual([1001, 1002, 1004, 1005], seq.frames_array().tolist())
+
     def test_getPathFromFrameNumber(self):
         """ Ensure specific path(s) can be retrieve from a Sequence.
         """
@@ -156,6 +216,28 @@ class TestSequenceAbsolute(unittest.TestCase):
             ),
         )
 
+    def test_frame_paths(self):
+        """ Ensure absolute paths can be retrieved in bulk from a Sequence.
+        """
+        self.assertEqual(
+            [self._sequence_basename + "1005.ext", self._sequence_basename + "1002.ext"],
+            self._sequence.frame_paths([1005, 1002]),
+        )
+
+        with self.assertRaises(ValueError):
+            self._sequence.frame_paths([1001, 1008])
+
+    def test_iter_paths(self):
+        """ Ensure absolute paths can be iterated from a Sequence, even with special characters.
+        """
+        self.assertEqual(list(self._sequence), list(self._sequence.iter_paths()))
+
+        seq = sequence.Sequence(fileseq.FileSequence("/path/to/100%/file%s.1-2#.ext"))
+        self.assertEqual(
+            [os.path.abspath("/path/to/100%/file%s.0001.ext"), os.path.abspath("/path/to/100%/file%s.0002.ext")],
+            list(seq.iter_paths()),
+        )
+
     def test_getPathFromFrameNumber_missingFrame(self):
         """ Ensure a path to a missing frame cannot be retrieved (can be updated later on).
         """
@@ -414,6 +496,23 @@ class TestSequenceInit(unittest.TestCase):
             _ = sequence.Sequence.from_string("not_a_string_sequence")
         self.assertEqual("Invalid path: not_a_string_sequence.", str(error.exception))
 
+    def test_from_string_cache(self):
+        """ Ensure a string is only parsed once, and a path which cannot be a sequence is not parsed.
+        """
+        _sequence._parse_sequence_string.cache_clear()
+
+        with mock.patch.object(_sequence._utils, "conform_path", wraps=_sequence._utils.conform_path) as conform_path:
+            seq1 = sequence.Sequence.from_string("/path/to/cache/file.%04d.ext 1-10")
+            seq2 = sequence.Sequence.from_string("/path/to/cache/file.%04d.ext 1-10")
+
+            with self.assertRaises(ValueError):
+                sequence.Sequence.from_string("/path/to/cache/clip.mov")
+
+        self.assertEqual(1, conform_path.call_count)
+        self.assertIsNot(seq1, seq2)
+        self.assertEqual(seq1, seq2)
+        self.assertEqual(repr(seq1), repr(seq2))
+
     def test_from_string_no_prefix(self):
         """ Ensure a Sequence object can be initialized from a string with no directory or prefix.
         """
@@ -534,6 +633,30 @@ class TestSequenceInit(unittest.TestCase):
         listSequence = sequence.Sequence.from_list(["/path/to/a/file.09.exr", "/path/to/a/file.11.exr",])
         self.assertEqual(True, listSequence.has_leading_zeros)
 
+    def test_from_list_no_fileseq(self):
+        """ Ensure a Sequence from a list builds no fileseq object until it is asked for.
+        """
+        paths = ["/path/to/a/file.%04d.exr" % frame for frame in (1, 2, 3, 5, 8)]
+
+        with mock.patch.object(
+            _sequence._utils, "build_fileSeq_sequence", wraps=_sequence._utils.build_fileSeq_sequence
+        ) as build_fileSeq_sequence:  # pylint: disable=protected-access
+            listSequence = sequence.Sequence.from_list(paths)
+            self.assertEqual(paths, list(listSequence))
+            self.assertEqual(4, listSequence.padding)
+            self.assertEqual(
+                ["/path/to/a/file.0004.exr", "/path/to/a/file.0006.exr", "/path/to/a/file.0007.exr"],
+                listSequence.missing,
+            )
+            self.assertEqual("/path/to/a/file.0005.exr", listSequence.get_frame_path(5))
+            self.assertEqual("<Sequence /path/to/a/file.1-3,5,8#.exr>", repr(listSequence))
+            build_fileSeq_sequence.assert_not_called()
+
+            self.assertEqual("/path/to/a/file.1-3,5,8#.exr", str(listSequence._data))  # pylint: disable=protected-access
+            build_fileSeq_sequence.assert_called_once()
+
+        self.assertEqual(paths, list(listSequence._data))  # pylint: disable=protected-access
+
     def test_get_sequences_fromPath(self):
         """ Ensure a Sequence can be found on disk.
         """
@@ -592,6 +715,30 @@ class TestSequenceInit(unittest.TestCase):
             ),
         )
 
+    def test_iter_sequences_fromPath_unordered(self):
+        """ Ensure unordered Sequences found on disk are the same as the ordered ones,
+        hidden files and directories are ignored.
+        """
+        for index in range(1, 4):
+            open(os.path.join(self.tempDirectory, "path.%d.ext" % index), "a").close()  # touch file
+            open(os.path.join(self.tempDirectory, "file.%04d.ext" % index), "a").close()  # touch file
+            open(os.path.join(self.tempDirectory, ".hidden.%d.ext" % index), "a").close()  # touch file
+            os.mkdir(os.path.join(self.tempDirectory, "folder.%d" % index))
+
+        orderedSequences = list(sequence.Sequence.iter_sequences(self.tempDirectory))
+        unorderedSequences = list(sequence.Sequence.iter_sequences(self.tempDirectory, ordered=False))
+
+        self.assertEqual(
+            [
+                os.path.join(self.tempDirectory, "file.%04d.ext"),
+                os.path.join(self.tempDirectory, "path.%d.ext"),
+            ],
+            [seq.format(sequence.PredefinedFormat.SPRINTF) for seq in orderedSequences],
+        )
+        self.assertEqual(
+            sorted(orderedSequences, key=str), sorted(unorderedSequences, key=str),
+        )
+
     def test_getSequence_fromEmptyList(self):
         """ Ensure no sequences are retrieved from an empty list.
         """
@@ -622,6 +769,85 @@ class TestSequenceInit(unittest.TestCase):
         )
 
 
+class TestSequenceScan(unittest.TestCase):
+    """ Test out the lite_media_core.path_utils.sequence.Sequence.scan method.
+    """
+
+    def setUp(self):
+        """ Set up the testing class.
+        """
+        super(TestSequenceScan, self).setUp()
+        self.tempDirectory = tempfile.mkdtemp()
+        self.sequence = sequence.Sequence.from_string(os.path.join(self.tempDirectory, "file.%04d.ext 1-10"))
+
+        for index in (1, 2, 3, 5, 8):
+            with open(os.path.join(self.tempDirectory, "file.%04d.ext" % index), "w") as file_:
+                file_.write("data" * index)
+
+        for name in ("file.0004.ext", "file.4.ext", "file.0011.ext", "file.0006.other", "other.0006.ext"):
+            open(os.path.join(self.tempDirectory, name), "a").close()  # touch file
+
+    def tearDown(self):
+        """ Tear down the testing class.
+        """
+        super(TestSequenceScan, self).tearDown()
+        shutil.rmtree(self.tempDirectory)
+
+    def test_scan(self):
+        """ Ensure present, missing and empty frames are found on disk.
+        """
+        result = self.sequence.scan()
+
+        self.assertEqual(
+            ([1, 2, 3, 4, 5, 8], [6, 7, 9, 10], [4], {1: 4, 2: 8, 3: 12, 4: 0, 5: 20, 8: 32}),
+            (result.present, sorted(result.missing), result.empty, result.sizes),
+        )
+
+    def test_scan_fallback(self):
+        """ Ensure frames are stat individually when the directory is much larger than the sequence.
+        """
+        for index in range(100):
+            open(os.path.join(self.tempDirectory, "noise_%d.txt" % index), "a").close()  # touch file
+
+        with mock.patch.object(_sequence, "_SCAN_MIN_ENTRIES", 0):
+            result = self.sequence.scan()
+
+        self.assertEqual(
+            ([1, 2, 3, 4, 5, 8], [6, 7, 9, 10], [4]),
+            (result.present, sorted(result.missing), result.empty),
+        )
+
+    def test_scan_missing_directory(self):
+        """ Ensure all frames are missing when the directory does not exist.
+        """
+        result = sequence.Sequence.from_string(os.path.join(self.tempDirectory, "missing", "file.%04d.ext 1-3")).scan()
+        self.assertEqual(([], [1, 2, 3]), (result.present, sorted(result.missing)))
+
+    def test_scan_not_a_directory(self):
+        """ Ensure all frames are missing when the directory is a file.
+        """
+        file_path = os.path.join(self.tempDirectory, "file.0001.ext")
+        result = sequence.Sequence.from_string(os.path.join(file_path, "file.%04d.ext 1-3")).scan()
+        self.assertEqual(([], [1, 2, 3]), (result.present, sorted(result.missing)))
+
+    def test_scan_unreadable_directory(self):
+        """ Ensure frames are stat individually when the directory cannot be listed.
+        """
+        with mock.patch.object(_sequence.os, "scandir", side_effect=PermissionError("Permission denied")):
+            result = self.sequence.scan()
+
+        self.assertEqual(
+            ([1, 2, 3, 4, 5, 8], [6, 7, 9, 10], [4]),
+            (result.present, sorted(result.missing), result.empty),
+        )
+
+    def test_scan_no_frame_range(self):
+        """ Ensure a sequence without frame range cannot be scanned.
+        """
+        with self.assertRaises(sequence.NoFrameRangeError):
+            sequence.Sequence.from_string("/path/to/a.%04d.exr", allow_empty=True).scan()
+
+
 class BaseSequenceTestCase(unittest.TestCase):
     """ Base test cases for a sequence.
     """
@@ -2,6 +2,7 @@
 """
 import unittest
 
+from lite_media_core.path_utils.sequence import _utils
 from lite_media_core.path_utils.sequence._utils import conform_path
 
 
@@ -139,3 +140,106 @@ class TestConformPath(unittest.TestCase):
             conform_path("dir/img.%04d_suffix.ext")
 
         self.assertEqual(str(error.exception), "Invalid path: dir/img.%04d_suffix.ext.")
+
+
+class TestHasSequenceHint(unittest.TestCase):
+    """ Test cases for the `has_sequence_hint` method.
+    """
+
+    def test_hint(self):
+        """ Ensure paths with a padding token, a frame before their extension or a trailing range have a hint.
+        """
+        for path in (
+            "dir/img.####.exr",
+            "dir/img.@@.exr",
+            "dir/img.%04d.exr",
+            "dir/img.$F4.exr",
+            "dir/img.1001.exr",
+            "dir/img.(1-10).exr",
+            "dir/img.1001.tar.gz",
+            "dir/img.exr 1-10",
+            "dir/img.exr 1-10 ([5])",
+        ):
+            self.assertTrue(_utils.has_sequence_hint(path), path)
+
+    def test_no_hint(self):
+        """ Ensure paths which cannot be sequences have no hint.
+        """
+        for path in (
+            "dir/clip.mov",
+            "/shot010/v002/clip.mov",
+            "dir/my clip.mov",
+            "not_a_string_sequence",
+        ):
+            self.assertFalse(_utils.has_sequence_hint(path), path)
+
+
+class TestFindSequencesInList(unittest.TestCase):
+    """ Test cases for the `find_sequences_in_list` method.
+    """
+
+    PATHS = [
+        "/shot010/img.1001.exr",
+        "/shot010/img.1002.exr",
+        "/shot010/img.1004.exr",
+        "/shot010/img.0001.exr",
+        "/shot010/img.001.exr",
+        "/shot010/img.-05.tar.gz",
+        "/shot010/img.-04.tar.gz",
+        "/shot010/img.exr",
+        "/shot010/notes.txt",
+        "/shot010/0001-0010.ext",
+        "/shot020/img.1001.exr",
+        "/shot030/img_-1.png",
+        "/shot030/img_0.png",
+        "/shot030/img_1.png",
+    ]
+
+    def test_native(self):
+        """ Test sequences and remains found by the native backend.
+        """
+        sequences, remains = _utils.find_sequences_in_list(self.PATHS, _utils.BACKEND_NATIVE)
+
+        self.assertEqual(
+            [str(sequence) for sequence in sequences],
+            [
+                "/shot010/img.-5--4@@@.tar.gz",
+                "/shot010/img.1,1001-1002,1004@@@.exr",
+                "/shot020/img.1001@.exr",
+                "/shot030/img_-1-1@.png",
+            ],
+        )
+        self.assertEqual(
+            remains,
+            {
+                "/shot010/img.0001.exr",
+                "/shot010/img.exr",
+                "/shot010/notes.txt",
+                "/shot010/0001-0010.ext",
+            },
+        )
+
+    def test_backends(self):
+        """ Ensure the native and fileseq backends find the same sequences and remains.
+        """
+        for paths in (
+            self.PATHS,
+            [],
+            ["img.exr8.exr", "img.exr008.exr", "img.exr-12.exr"],
+            ["img.1.exr", "img.1.exr", "img.01.exr"],
+            ["/a/img.%04d.exr" % frame for frame in range(-10, 100, 3)],
+        ):
+            native_sequences, native_remains = _utils.find_sequences_in_list(paths, _utils.BACKEND_NATIVE)
+            fileseq_sequences, fileseq_remains = _utils.find_sequences_in_list(paths, _utils.BACKEND_FILESEQ)
+
+            self.assertEqual(
+                [(str(sequence), sequence.zfill()) for sequence in native_sequences],
+                [(str(sequence), sequence.zfill()) for sequence in fileseq_sequences],
+            )
+            self.assertEqual(native_remains, fileseq_remains)
+
+    def test_invalid_backend(self):
+        """ Ensure a ValueError is raised for an unknown backend.
+        """
+        with self.assertRaises(ValueError):
+            _utils.find_sequences_in_list(["img.1.exr"], "unknown")